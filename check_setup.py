@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+EPUB to Audiobook Converter - Setup Checker
+
+Quickly verifies the Python version, required packages, project files,
+and system dependencies without importing any of the heavy packages.
+"""
+
+import os
+import sys
+import shutil
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Packages whose pip name differs from their import name
+IMPORT_NAMES = {
+    "beautifulsoup4": "bs4",
+}
+
+# Version checks evaluated once at import; the interpreter can't change
+# underneath us, so repeated calls shouldn't re-derive the comparisons
+_PY = sys.version_info[:3]
+_PY_OK = _PY[:2] >= (3, 8)
+_PY_WARN = _PY[:2] >= (3, 13)
+
+def check_python_version():
+    """Check if the Python version is compatible."""
+    print(f"🐍 Python version: {_PY[0]}.{_PY[1]}.{_PY[2]}")
+
+    if not _PY_OK:
+        print("❌ Python 3.8 or higher is required")
+        return False
+
+    if _PY_WARN:
+        print("⚠️  Warning: Python 3.13+ may have compatibility issues with TTS")
+
+    return True
+
+def check_dependencies():
+    """Check which required packages are installed.
+
+    Uses importlib.util.find_spec so the probe only touches finder
+    metadata - it never executes module code, which matters for TTS
+    and torch where a real import costs seconds and hundreds of MB.
+    """
+    dependencies = [
+        "ebooklib",
+        "beautifulsoup4",
+        "click",
+        "colorama",
+        "pydub",
+        "mutagen",
+        "numpy",
+        "soundfile",
+        "torch",
+        "TTS",
+    ]
+
+    def probe(dep):
+        return dep, importlib.util.find_spec(IMPORT_NAMES.get(dep, dep)) is not None
+
+    # The probes are independent I/O-bound lookups, so run them all at
+    # once; results come back in submission order so the output stays stable.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(probe, dependencies))
+
+    missing = []
+    for dep, ok in results:
+        if ok:
+            print(f"✅ {dep}")
+        else:
+            print(f"❌ {dep} - Missing")
+            missing.append(dep)
+
+    return missing
+
+def _probe_ffmpeg():
+    """Locate FFmpeg on PATH without forking a subprocess."""
+    return shutil.which("ffmpeg")
+
+def check_system_deps(available=None):
+    """Check system-level dependencies (FFmpeg)."""
+    if available is None:
+        available = _probe_ffmpeg()
+
+    if available:
+        print(f"✅ FFmpeg is available ({available})")
+        return True
+
+    print("❌ FFmpeg not found")
+    print("   Download from: https://ffmpeg.org/download.html")
+    return False
+
+def check_project_structure():
+    """Check that the expected project files are present."""
+    required_files = [
+        "main.py",
+        "demo.py",
+        "requirements.txt",
+        "src/epub_parser.py",
+        "src/text_processor.py",
+        "src/config_manager.py",
+        "src/logger.py",
+    ]
+
+    # One walk over the tree instead of a stat per required file; syscall
+    # count stays constant however long the required list grows.
+    skip_dirs = {".git", "__pycache__", ".venv", "venv", "node_modules"}
+    present = set()
+    for root, dirs, files in os.walk(".", topdown=True):
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        for f in files:
+            present.add(os.path.relpath(os.path.join(root, f)).replace(os.sep, "/"))
+
+    missing = []
+    for file in required_files:
+        if file in present:
+            print(f"✅ {file}")
+        else:
+            print(f"❌ {file} - Missing")
+            missing.append(file)
+
+    return missing
+
+def show_file_structure():
+    """Show the working folders and a sample of their contents."""
+    for folder in ("input", "output", "src"):
+        path = Path(folder)
+        if not path.is_dir():
+            print(f"📁 {folder}/ - Missing")
+            continue
+
+        print(f"📁 {folder}/")
+        # One scandir sweep per folder: DirEntry.name comes straight
+        # from the directory entry, no stat calls and no re-listing
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        total = len(entries)
+        for item in entries[:5]:
+            print(f"   📄 {item.name}")
+        if total > 5:
+            print(f"   ... and {total - 5} more files")
+
+def main():
+    """Run all setup checks."""
+    print("🔎 EPUB to Audiobook Converter - Setup Check")
+    print("=" * 60)
+
+    ok = check_python_version()
+
+    # Start the ffmpeg subprocess probe early so it overlaps with the
+    # package checks instead of serializing behind them.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ffmpeg_future = executor.submit(_probe_ffmpeg)
+
+        print("\n📋 Checking Python packages...")
+        missing_packages = check_dependencies()
+
+        print("\n🎬 Checking system dependencies...")
+        check_system_deps(available=ffmpeg_future.result())
+
+    print("\n🏠 Checking project structure...")
+    missing_files = check_project_structure()
+
+    print("\n📂 File structure:")
+    show_file_structure()
+
+    print("\n" + "=" * 60)
+    if ok and not missing_packages and not missing_files:
+        print("🎉 Setup looks good! Run: python main.py --help")
+    else:
+        if missing_packages:
+            print(f"📦 Install missing packages: pip install {' '.join(missing_packages)}")
+        if missing_files:
+            print("⚠️  Some project files are missing - re-download the project.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,52 @@
 #!/usr/bin/env python3
 """
-Debug version of main script to identify hanging issues
+Debug version of main script to identify slow or hanging imports.
+
+Times each import and records how many modules it pulls in, then prints
+a profile table so the offending transitive dependency is obvious.
 """
 
-print("🔍 Debug: Starting imports...")
+import sys
+import time
+
+def timed(name, fn):
+    """Run an import callable and measure wall time and module count delta."""
+    t0 = time.perf_counter()
+    n0 = len(sys.modules)
+    fn()
+    return name, (time.perf_counter() - t0) * 1000, len(sys.modules) - n0
+
+print("🔍 Debug: Profiling imports...\n")
+
+imports = [
+    ("click", lambda: __import__("click")),
+    ("colorama", lambda: __import__("colorama")),
+    ("ConfigManager", lambda: __import__("src.config_manager", fromlist=["ConfigManager"])),
+    ("setup_logger", lambda: __import__("src.logger", fromlist=["setup_logger"])),
+    ("EPUBParser", lambda: __import__("src.epub_parser", fromlist=["EPUBParser"])),
+    ("TextProcessor", lambda: __import__("src.text_processor", fromlist=["TextProcessor"])),
+    ("AudioProcessor", lambda: __import__("src.audio_processor", fromlist=["AudioProcessor"])),
+    ("TTSEngine", lambda: __import__("src.tts_engine", fromlist=["TTSEngine"])),
+]
+
+results = []
+failed = False
+
+for name, fn in imports:
+    try:
+        results.append(timed(name, fn))
+    except Exception as e:
+        failed = True
+        print(f"❌ Error importing {name}: {e}")
+        import traceback
+        traceback.print_exc()
+
+if results:
+    print(f"{'import':<20} {'time':>10}  {'modules':>8}")
+    print("-" * 42)
+    for name, ms, n_mods in sorted(results, key=lambda r: r[1], reverse=True):
+        print(f"{name:<20} {ms:8.2f}ms  +{n_mods} modules")
 
-try:
-    print("1. Importing standard libraries...")
-    import os
-    import sys
-    import logging
-    from pathlib import Path
-    print("✅ Standard libraries OK")
-    
-    print("2. Importing click...")
-    import click
-    print("✅ Click OK")
-    
-    print("3. Importing colorama...")
-    from colorama import init, Fore, Style
-    init()
-    print("✅ Colorama OK")
-    
-    print("4. Importing config manager...")
-    from src.config_manager import ConfigManager
-    print("✅ Config Manager OK")
-    
-    print("5. Importing logger...")
-    from src.logger import setup_logger
-    print("✅ Logger OK")
-    
-    print("6. Importing EPUB parser...")
-    from src.epub_parser import EPUBParser
-    print("✅ EPUB Parser OK")
-    
-    print("7. Importing text processor...")
-    from src.text_processor import TextProcessor
-    print("✅ Text Processor OK")
-    
-    print("8. Importing audio processor...")
-    from src.audio_processor import AudioProcessor
-    print("✅ Audio Processor OK")
-    
-    print("9. Testing TTS engine import...")
-    from src.tts_engine import TTSEngine
-    print("✅ TTS Engine OK")
-    
+if not failed:
     print("\n🎉 All imports successful!")
-    
-    # Test click command creation
-    print("\n10. Testing click command...")
-    
-    @click.command()
-    @click.option('--test', default='hello', help='Test option')
-    def test_command(test):
-        """Test command to verify click works"""
-        click.echo(f"Test successful: {test}")
-    
-    print("✅ Click command creation OK")
-    print("\n🎉 Main script should work now!")
-    
-except Exception as e:
-    print(f"❌ Error during import: {e}")
-    import traceback
-    traceback.print_exc()
+    print("🎉 Main script should work now!")
@@ -7,19 +7,42 @@ This script demonstrates various ways to use the converter programmatically.
 import os
 import sys
 import logging
+import functools
+import importlib
+import importlib.util
+import types
 from pathlib import Path
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# When run as a script, make the project root importable; when imported
+# as a module we rely on the caller's sys.path and don't grow it, since
+# every extra entry multiplies stat calls for all later imports
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.epub_parser import EPUBParser
 from src.text_processor import TextProcessor
-from src.tts_engine import TTSEngine
-from src.audio_processor import AudioProcessor
 from src.config_manager import ConfigManager
 from src.logger import setup_logger
 
+class _LazyModule(types.ModuleType):
+    """Module proxy that defers the real import until first attribute access."""
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        sys.modules[self.__name__] = module
+        return getattr(module, attr)
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return a proxy for a module that is only imported when first used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
+
+@functools.lru_cache(maxsize=4)
+def _get_config_manager(config_path=None):
+    """Build (or reuse) a ConfigManager for the given config file path."""
+    return ConfigManager(config_path)
+
 def example_basic_conversion():
     """Example of basic EPUB to audiobook conversion."""
     print("=== Basic Conversion Example ===")
@@ -38,11 +61,16 @@ def example_basic_conversion():
         'chapter_pause': 2.0
     }
     
+    # Heavy TTS/audio modules (torch, Coqui-TTS, pydub) are only pulled in
+    # here, so importing examples.py as a library never loads them
+    tts_engine_mod = lazy_import("src.tts_engine")
+    audio_processor_mod = lazy_import("src.audio_processor")
+
     # Initialize components
     epub_parser = EPUBParser()
     text_processor = TextProcessor()
-    tts_engine = TTSEngine(config)
-    audio_processor = AudioProcessor(config)
+    tts_engine = tts_engine_mod.TTSEngine(config)
+    audio_processor = audio_processor_mod.AudioProcessor(config)
     
     # Example EPUB file path (you would replace this with an actual file)
     epub_path = "input/sample.epub"
@@ -85,10 +113,11 @@ def example_basic_conversion():
         # Merge into audiobook
         if audio_files:
             logger.info("Creating audiobook...")
-            output_file = audio_processor.merge_audiobook(audio_files, book_data, output_dir)
+            result = audio_processor.merge_audiobook(audio_files, book_data, output_dir)
             
-            if output_file:
-                logger.info(f"Audiobook created: {output_file}")
+            if result:
+                output_file, byte_count = result
+                logger.info(f"Audiobook created: {output_file} ({byte_count / (1024 * 1024):.2f} MB)")
             else:
                 logger.error("Failed to create audiobook")
         
@@ -103,8 +132,8 @@ def example_configuration_usage():
     """Example of using configuration files."""
     print("\n=== Configuration Example ===")
     
-    # Create configuration manager
-    config_manager = ConfigManager()
+    # Create configuration manager (memoized across example runs)
+    config_manager = _get_config_manager()
     
     # Show default configuration
     print("Default configuration keys:")
@@ -117,7 +146,7 @@ def example_configuration_usage():
     print(f"\nSample configuration created: {sample_config_path}")
     
     # Load configuration from file
-    config_with_file = ConfigManager(sample_config_path)
+    config_with_file = _get_config_manager(sample_config_path)
     print("Configuration loaded from file successfully")
 
 def example_text_processing():
@@ -171,11 +200,12 @@ def main():
     print("EPUB to Audiobook Converter - Examples")
     print("="*50)
     
-    # Create directories if they don't exist
-    os.makedirs("input", exist_ok=True)
-    os.makedirs("output", exist_ok=True)
-    os.makedirs("config", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
+    # Create directories if they don't exist; one scandir tells us which
+    # already do, so repeat runs skip the makedirs stat chains entirely
+    existing = {entry.name for entry in os.scandir('.')}
+    for directory in ("input", "output", "config", "logs"):
+        if directory not in existing:
+            os.makedirs(directory, exist_ok=True)
     
     try:
         # Run examples
@@ -183,13 +213,12 @@ def main():
         example_text_processing()
         example_epub_info()
         
-        # Only run conversion if we have the required dependencies
-        try:
-            import torch
-            import TTS
+        # Only run conversion if we have the required dependencies.
+        # find_spec() checks availability without actually loading torch/TTS.
+        if importlib.util.find_spec("torch") and importlib.util.find_spec("TTS"):
             example_basic_conversion()
-        except ImportError as e:
-            print(f"\nSkipping conversion example due to missing dependencies: {e}")
+        else:
+            print("\nSkipping conversion example due to missing dependencies: torch/TTS")
             print("Install all requirements with: pip install -r requirements.txt")
         
     except KeyboardInterrupt:
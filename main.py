@@ -9,25 +9,30 @@ import os
 import sys
 import logging
 import argparse
-from pathlib import Path
+import importlib
 from typing import Optional, Dict, Any
 
 import click
 from colorama import init, Fore, Style
 
-from src.epub_parser import EPUBParser
-from src.text_processor import TextProcessor
-from src.tts_engine import TTSEngine
-from src.audio_processor import AudioProcessor
-from src.config_manager import ConfigManager
-from src.logger import setup_logger
+# Heavy components (torch/TTS/pydub behind these) are resolved lazily so
+# `--help` doesn't pay seconds of import time before printing usage
+_LAZY = {
+    'ConfigManager': 'src.config_manager',
+    'setup_logger': 'src.logger',
+    'run_conversion': 'src.pipeline',
+}
+
+def _load(name: str):
+    """Import and return a component from the lazy registry."""
+    return getattr(importlib.import_module(_LAZY[name]), name)
 
 # Initialize colorama for cross-platform colored output
 init()
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Setup application logging."""
-    return setup_logger("epub_to_audiobook", log_level)
+    return _load('setup_logger')("epub_to_audiobook", log_level)
 
 @click.command()
 @click.option('--input', '-i', 'input_path', required=True, 
@@ -51,6 +56,9 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
               help='Output audio format (default: m4b)')
 @click.option('--gpu', is_flag=True, default=False,
               help='Enable GPU acceleration for TTS processing')
+@click.option('--precision', type=click.Choice(['fp32', 'fp16', 'int8']),
+              default='fp16',
+              help='TTS model precision (fp16 applies on GPU, int8 on CPU; default: fp16)')
 @click.option('--config', '-c', 'config_file',
               type=click.Path(exists=True, file_okay=True, dir_okay=False),
               help='Path to configuration file')
@@ -60,9 +68,12 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
               help='Logging level (default: INFO)')
 @click.option('--chapter-pause', default=2.0, type=float,
               help='Pause duration between chapters in seconds (default: 2.0)')
+@click.option('--stream', 'stream_output', is_flag=True, default=False,
+              help='Stream audio straight into the final file, skipping per-chapter WAVs (requires ffmpeg)')
 def main(input_path: str, output_dir: str, voice: str, speaker: str, 
          speed: float, pitch: float, output_format: str, gpu: bool,
-         config_file: Optional[str], log_level: str, chapter_pause: float):
+         precision: str, config_file: Optional[str], log_level: str,
+         chapter_pause: float, stream_output: bool):
     """
     Convert EPUB eBooks to audiobooks using advanced text-to-speech technology.
     
@@ -81,7 +92,7 @@ def main(input_path: str, output_dir: str, voice: str, speaker: str,
         click.echo(f"{Fore.GREEN}Output: {output_dir}{Style.RESET_ALL}\n")
         
         # Load configuration
-        config_manager = ConfigManager(config_file)
+        config_manager = _load('ConfigManager')(config_file)
         config = config_manager.get_config()
         
         # Override config with command line arguments
@@ -91,80 +102,21 @@ def main(input_path: str, output_dir: str, voice: str, speaker: str,
             'speed': speed,
             'pitch': pitch,
             'gpu_acceleration': gpu,
+            'precision': precision,
             'output_format': output_format.lower(),
-            'chapter_pause': chapter_pause
+            'chapter_pause': chapter_pause,
+            'stream_output': stream_output
         })
         
-        # Create output directory
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
-        # Initialize components
-        epub_parser = EPUBParser()
-        text_processor = TextProcessor()
-        tts_engine = TTSEngine(config)
-        audio_processor = AudioProcessor(config)
-        
-        # Parse EPUB file
-        logger.info("Parsing EPUB file...")
-        book_data = epub_parser.parse_epub(input_path)
-        
-        if not book_data['chapters']:
-            logger.error("No chapters found in EPUB file")
-            return
-        
-        click.echo(f"{Fore.GREEN}✓{Style.RESET_ALL} Found {len(book_data['chapters'])} chapters")
-        
-        # Process each chapter
-        audio_files = []
-        total_chapters = len(book_data['chapters'])
+        # Run the shared conversion pipeline
+        result = _load('run_conversion')(config, input_path, output_dir)
         
-        with click.progressbar(book_data['chapters'], label='Converting chapters') as chapters:
-            for i, chapter in enumerate(chapters):
-                logger.info(f"Processing chapter {i+1}/{total_chapters}: {chapter['title']}")
-                
-                # Clean and process text
-                processed_text = text_processor.clean_text(chapter['content'])
-                
-                if not processed_text.strip():
-                    logger.warning(f"Chapter {i+1} has no content, skipping...")
-                    continue
-                
-                # Generate audio for chapter
-                audio_file = tts_engine.text_to_speech(
-                    processed_text, 
-                    chapter['title'], 
-                    output_dir,
-                    chapter_num=i+1
-                )
-                
-                if audio_file:
-                    audio_files.append({
-                        'file': audio_file,
-                        'title': chapter['title'],
-                        'chapter_num': i+1
-                    })
-        
-        if not audio_files:
-            logger.error("No audio files were generated")
-            return
-        
-        click.echo(f"\n{Fore.GREEN}✓{Style.RESET_ALL} Generated {len(audio_files)} audio files")
-        
-        # Merge audio files into final audiobook
-        logger.info("Merging audio files into audiobook...")
-        output_file = audio_processor.merge_audiobook(
-            audio_files, 
-            book_data, 
-            output_dir
-        )
-        
-        if output_file:
+        if result:
+            # Size comes back from the merge, so no extra stat call here
+            output_file, byte_count = result
             click.echo(f"\n{Fore.GREEN}🎉 Audiobook created successfully!{Style.RESET_ALL}")
             click.echo(f"{Fore.CYAN}Output file: {output_file}{Style.RESET_ALL}")
-            
-            # Display file info
-            file_size = os.path.getsize(output_file) / (1024 * 1024)  # MB
-            click.echo(f"{Fore.YELLOW}File size: {file_size:.2f} MB{Style.RESET_ALL}")
+            click.echo(f"{Fore.YELLOW}File size: {byte_count / (1024 * 1024):.2f} MB{Style.RESET_ALL}")
         else:
             logger.error("Failed to create audiobook")
             
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Interactive launcher for the EPUB to Audiobook Converter.
+Checks dependencies, lists EPUB files from the input directory,
+and starts a conversion on the selected book.
+"""
+
+import os
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+def _probe(module: str) -> bool:
+    """Check whether a module is importable, without executing it."""
+    import importlib.util
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+def check_and_guide():
+    """Check dependencies and tell the user what's missing."""
+    print("🔍 Checking dependencies...")
+
+    deps_available = {
+        'click': 'click',
+        'colorama': 'colorama',
+        'ebooklib': 'ebooklib',
+        'bs4': 'beautifulsoup4',
+        'pydub': 'pydub',
+        'mutagen': 'mutagen',
+        'torch': 'torch',
+        'TTS': 'TTS',
+    }
+
+    # Probe every module at once: find_spec only reads metadata (no module
+    # code runs), so the slowest probe bounds the wall time instead of
+    # paying for all of them in sequence
+    with ThreadPoolExecutor(max_workers=len(deps_available)) as executor:
+        results = dict(zip(deps_available, executor.map(_probe, deps_available)))
+
+    missing = []
+    for module, package in deps_available.items():
+        if results[module]:
+            print(f"  ✅ {package}")
+        else:
+            print(f"  ❌ {package}")
+            missing.append(package)
+
+    if missing:
+        print(f"\n⚠️  Missing packages: {', '.join(missing)}")
+        print(f"   Install with: pip install {' '.join(missing)}")
+        return False
+
+    print("\n✅ All dependencies available!")
+    return True
+
+def try_run_interactive(script: str = "main.py"):
+    """Pick an EPUB from the input directory and run the converter on it."""
+    input_dir = Path("input")
+    input_dir.mkdir(exist_ok=True)
+
+    # scandir returns file type straight from the directory entry, so a
+    # big input folder is listed without a stat call per file
+    epub_files = sorted(
+        Path(entry.path) for entry in os.scandir(input_dir)
+        if entry.is_file(follow_symlinks=False)
+        and entry.name.lower().endswith('.epub')
+    )
+
+    if not epub_files:
+        print("\n📖 No EPUB files found in the input directory.")
+        print("   Copy a book into ./input and run this again.")
+        return
+
+    print("\n📚 Available EPUB files:")
+    for i, epub_file in enumerate(epub_files, 1):
+        print(f"  {i}. {epub_file.name}")
+
+    try:
+        choice = input("\nSelect a file number (or press Enter for 1): ").strip()
+        index = int(choice) - 1 if choice else 0
+        selected_file = epub_files[index]
+    except (ValueError, IndexError):
+        print("❌ Invalid selection")
+        return
+
+    print(f"\n🚀 Converting: {selected_file.name}")
+    # Nothing left to do after the converter finishes, so replace this
+    # process instead of forking a shell and a child interpreter; this
+    # also handles paths with spaces without any quoting
+    os.execvp(sys.executable, [sys.executable, script, '-i', str(selected_file)])
+
+def main():
+    print("🎧 EPUB to Audiobook Converter - Launcher")
+    print("=" * 50)
+
+    if not check_and_guide():
+        print("\nRunning the full setup check for details...")
+        os.execvp(sys.executable, [sys.executable, 'check_setup.py'])
+
+    try_run_interactive()
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,14 @@ This script helps install all required dependencies for the project.
 import sys
 import subprocess
 import platform
+import functools
 import importlib.util
 
+# Constant across the whole run, so compute once instead of rebuilding
+# the pip prefix and re-querying the platform in every installer
+_PIP = [sys.executable, "-m", "pip", "install"]
+_IS_WINDOWS = platform.system() == "Windows"
+
 def check_python_version():
     """Check if Python version is compatible."""
     version = sys.version_info
@@ -29,37 +35,66 @@ def check_python_version():
     
     return True
 
+@functools.lru_cache(maxsize=None)
 def check_package(package_name, import_name=None):
-    """Check if a package is installed."""
+    """Check if a package is installed, without importing it.
+
+    find_spec only consults package metadata, so probing torch/librosa/
+    TTS costs milliseconds instead of running their import-time setup.
+    Results are memoized; installers call cache_clear() after changing
+    the environment.
+    """
     if import_name is None:
         import_name = package_name
-    
+
+    # Probe the top-level package: find_spec on a dotted name would
+    # import the parent, which is exactly the cost we're avoiding
+    top_level = import_name.partition('.')[0]
+
     try:
-        importlib.import_module(import_name)
-        return True
-    except ImportError:
+        return importlib.util.find_spec(top_level) is not None
+    except (ImportError, ValueError):
         return False
 
 def install_package(package_name):
     """Install a package using pip."""
     try:
         print(f"📦 Installing {package_name}...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+        subprocess.check_call([*_PIP, package_name])
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to install {package_name}: {e}")
         return False
 
+def install_packages(package_names):
+    """Install several packages with a single pip invocation.
+
+    One pip run resolves dependencies for the whole set at once instead
+    of restarting pip and its resolver per package. If the batch fails,
+    packages are retried individually so one bad pin doesn't block the
+    rest.
+    """
+    if not package_names:
+        return True
+
+    try:
+        print(f"📦 Installing {len(package_names)} packages: {', '.join(package_names)}")
+        subprocess.check_call([*_PIP, *package_names])
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  Batch install failed ({e}), retrying individually...")
+        return all([install_package(pkg) for pkg in package_names])
+
 def install_pytorch():
     """Install PyTorch with appropriate version."""
     print("🔥 Installing PyTorch...")
     try:
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # Install CPU version for Windows
-            cmd = [sys.executable, "-m", "pip", "install", "torch", "torchaudio", 
+            cmd = [*_PIP, "torch", "torchaudio",
                    "--index-url", "https://download.pytorch.org/whl/cpu"]
         else:
-            cmd = [sys.executable, "-m", "pip", "install", "torch", "torchaudio"]
+            cmd = [*_PIP, "torch", "torchaudio"]
         
         subprocess.check_call(cmd)
         return True
@@ -82,7 +117,7 @@ def install_tts():
     for attempt in attempts:
         try:
             print(f"   Trying: {attempt}")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", attempt])
+            subprocess.check_call([*_PIP, attempt])
             
             # Test if import works
             try:
@@ -104,10 +139,12 @@ def install_tts():
 def check_ffmpeg():
     """Check if FFmpeg is available."""
     try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+        # Bound the probe: a wedged ffmpeg shim must not hang setup
+        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True,
+                       timeout=2.0)
         print("✅ FFmpeg is available")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         print("❌ FFmpeg not found")
         print("   Download from: https://ffmpeg.org/download.html")
         print("   Add to your system PATH")
@@ -171,11 +208,9 @@ def main():
     
     print(f"\n📦 Installing {len(missing_packages)} missing packages...")
     
-    # Install regular packages
+    # Install regular packages in one pip run
     regular_packages = [pkg for pkg in missing_packages if pkg not in ["torch", "TTS"]]
-    if regular_packages:
-        for package in regular_packages:
-            install_package(package)
+    install_packages(regular_packages)
     
     # Install PyTorch if missing
     if "torch" in missing_packages:
@@ -186,7 +221,10 @@ def main():
         install_tts()
     
     print("\n🧪 Testing final installation...")
-    
+
+    # Installs above changed the environment; drop memoized probe results
+    check_package.cache_clear()
+
     # Test imports
     test_packages = [
         ("ebooklib", "ebooklib"),
@@ -198,6 +236,12 @@ def main():
     
     all_good = True
     for package, import_name in test_packages:
+        # Cheap metadata check first; only actually import what exists
+        if not check_package(package, import_name):
+            print(f"❌ {package} - Still missing")
+            all_good = False
+            continue
+
         try:
             importlib.import_module(import_name)
             print(f"✅ {package} - Working")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+EPUB to Audiobook Converter - Help and Usage Guide
+
+Prints an overview of the project: commands, installation steps,
+features, and usage examples.
+"""
+
+import sys
+
+# Banner separator, folded once at import instead of per section
+_BAR60 = "=" * 60
+
+# Static display tables, built once at import instead of rebuilt (and
+# re-allocated) on every call to the functions that print them
+_FEATURES = [
+    ("📚 EPUB Parsing", "Extracts chapters and metadata from EPUB files"),
+    ("🧹 Text Cleaning", "Normalizes text, expands abbreviations, strips URLs"),
+    ("🎤 Neural TTS", "High-quality speech via Coqui-TTS with GPU support"),
+    ("🌍 Languages", "Models for 12 languages, selectable per book"),
+    ("🎵 Audio Output", "Single m4b/mp3 audiobook with metadata and chapters"),
+    ("⚡ Performance", "Model caching, batching, and streaming output"),
+]
+
+_EXAMPLES = [
+    ("Convert with defaults", "python main.py -i input/book.epub"),
+    ("Spanish voice, mp3 output", "python main.py -i book.epub -v es -f mp3"),
+    ("Faster narration on GPU", "python main.py -i book.epub --gpu --speed 1.3"),
+    ("Stream straight to the final file", "python main.py -i book.epub --stream"),
+    ("Custom config file", "python main.py -i book.epub -c config/my.json"),
+]
+
+def show_main_help():
+    """Show the main command reference."""
+    # One buffered write per section: a print() per line would pay a
+    # formatting pass and a write syscall for every row of this table
+    sys.stdout.write("""\
+📚 EPUB to Audiobook Converter - Command Reference
+""" + _BAR60 + """
+
+Basic conversion:
+  python main.py -i book.epub
+  python main.py -i book.epub -o ./audiobooks
+
+Voice and audio options:
+  python main.py -i book.epub -v en -s default
+  python main.py -i book.epub --speed 1.2 --pitch 1.0
+  python main.py -i book.epub -f mp3
+  python main.py -i book.epub --gpu --precision fp16
+
+Other entry points:
+  python main_safe.py -i book.epub   (friendlier errors when TTS is broken)
+  python run.py                      (interactive launcher)
+  python simple_demo.py              (no-dependency pipeline demo)
+  python check_setup.py              (environment check)
+
+""")
+
+def show_installation_guide():
+    """Show how to install the project's dependencies."""
+    sys.stdout.write("""\
+🔧 Installation
+""" + _BAR60 + """
+
+1. Use Python 3.9 - 3.12 (TTS does not support 3.13 yet)
+2. Install the Python packages:
+     pip install -r requirements.txt
+   or run the guided installer:
+     python setup_dependencies.py
+3. Install FFmpeg and add it to your PATH:
+     https://ffmpeg.org/download.html
+
+""")
+
+def show_application_features():
+    """Show what the converter can do."""
+    sys.stdout.write(
+        "✨ Features\n" + _BAR60 + "\n"
+        + ''.join(f"  {title}: {description}\n" for title, description in _FEATURES)
+        + "\n")
+
+def show_usage_examples():
+    """Show worked command-line examples."""
+    sys.stdout.write(
+        "💡 Examples\n" + _BAR60 + "\n"
+        + ''.join(f"  {label}:\n    {command}\n" for label, command in _EXAMPLES)
+        + "\n")
+
+def main():
+    show_main_help()
+    show_installation_guide()
+    show_application_features()
+    show_usage_examples()
+    sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+EPUB to Audiobook Converter - Simplified Demo
+
+Walks through the conversion pipeline on a plain-text "book" using mock
+components, so it runs without any of the heavy TTS dependencies.
+"""
+
+import os
+import re
+import sys
+import mmap
+import itertools
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+# Matches a chapter heading line like "Chapter 1: The Beginning".
+# Bytes pattern so it can scan a memory-mapped file directly.
+_CHAPTER_RE = re.compile(rb'(?m)^[ \t]*Chapter [^\n]*\n?')
+
+# Sentence-ending punctuation, counted in one scan
+_SENT_RE = re.compile(r'[.!?]')
+
+# Banner separator, folded once at import
+_BAR60 = "=" * 60
+
+# A run of non-whitespace, i.e. one word; counting matches avoids the
+# transient list-of-every-word that split() would allocate per chapter
+_WORD_RE = re.compile(r'\S+')
+
+# Optional: with Numba installed, multi-MB chapters get their stats from
+# a JIT-compiled single pass over the raw bytes. The demo stays fully
+# functional without it via the regex/count fallback below.
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_stats(buf):
+        """Count words and sentence enders in one pass over UTF-8 bytes."""
+        words = 0
+        sentences = 0
+        in_word = False
+        for b in buf:
+            if b == 32 or b == 9 or b == 10 or b == 13:
+                if in_word:
+                    words += 1
+                    in_word = False
+            else:
+                in_word = True
+                if b == 46 or b == 33 or b == 63:
+                    sentences += 1
+        if in_word:
+            words += 1
+        return words, sentences
+
+    # Tiny warmup so the one-time JIT compile happens at import (and is
+    # reused from the on-disk cache after that), not mid-demo
+    _count_stats(np.frombuffer(b'a. ', dtype=np.uint8))
+
+class MockEPUBParser:
+    """Parses a plain text file with 'Chapter ...' headings like an EPUB."""
+
+    def iter_chapters(self, file_path):
+        """
+        Yield chapter dicts from a plain text file, one at a time.
+
+        Walks the headings with finditer and slices one body per step,
+        so only the current chapter is decoded and alive — a big book is
+        never fully materialized the way a chapter list would be.
+
+        Args:
+            file_path (str): Path to the text file
+
+        Yields:
+            dict: {'title': ..., 'content': ..., 'word_count': ...}
+        """
+        produced = False
+        full_text = b''
+
+        # Map the file instead of f.read(): the regex scans the OS page
+        # cache directly, so no full user-space copy of the book is made
+        # and only the chapter slices we keep get decoded to str
+        with open(file_path, 'rb') as f:
+            if os.path.getsize(file_path):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    prev_title = "Introduction"
+                    prev_end = 0
+
+                    for match in _CHAPTER_RE.finditer(buf):
+                        body = buf[prev_end:match.start()]
+                        # Text before the first heading only becomes an
+                        # introduction chapter when there is any
+                        if prev_end or body.strip():
+                            yield self._make_chapter(prev_title, body)
+                            produced = True
+                        prev_title = match.group().strip().decode('utf-8', 'ignore')
+                        prev_end = match.end()
+
+                    if prev_end:
+                        yield self._make_chapter(prev_title, buf[prev_end:])
+                        produced = True
+                    elif not produced:
+                        # No headings at all: copy the whole buffer out
+                        # now, because the mmap is closed by the time
+                        # the fallback below runs
+                        full_text = bytes(buf)
+
+        if not produced:
+            yield self._make_chapter("Full Text", full_text)
+
+    def parse_epub(self, file_path):
+        """
+        Parse chapters out of a plain text file.
+
+        Materializes the iter_chapters stream for callers that need the
+        whole book at once.
+
+        Args:
+            file_path (str): Path to the text file
+
+        Returns:
+            dict: {'metadata': ..., 'chapters': [...]} like the real parser
+        """
+        chapters = list(self.iter_chapters(file_path))
+
+        metadata = {
+            'title': os.path.splitext(os.path.basename(file_path))[0],
+            'author': 'Unknown Author',
+            'chapter_count': len(chapters)
+        }
+
+        return {'metadata': metadata, 'chapters': chapters}
+
+    def _make_chapter(self, title, body):
+        """Build one chapter dict from a heading and its body bytes."""
+        body = body.strip().decode('utf-8', 'ignore')
+        return {
+            'title': title,
+            'content': body,
+            'word_count': sum(1 for _ in _WORD_RE.finditer(body))
+        }
+
+class MockTextProcessor:
+    """Mimics the text cleaning and statistics of the real processor."""
+
+    def clean_text(self, text):
+        """Clean text for TTS processing."""
+        # split() already strips and collapses every kind of whitespace,
+        # so this is one C-level pass; the old newline re-split stage was
+        # dead code since no newlines survive the join
+        return ' '.join(text.split())
+
+    def get_text_statistics(self, text):
+        """Get basic statistics about cleaned (whitespace-collapsed) text."""
+        # Very large chapters take the JIT single-pass byte counter when
+        # it's available; below that the Python-level call overhead and
+        # the encode would outweigh the win
+        if NUMBA_AVAILABLE and len(text) >= 1 << 20:
+            words, sentences = _count_stats(
+                np.frombuffer(text.encode('utf-8'), dtype=np.uint8))
+            return {
+                'characters': len(text),
+                'words': words,
+                'sentences': sentences
+            }
+
+        # One regex sweep counts all three sentence enders instead of a
+        # full text.count() pass per character, and words come from the
+        # space count instead of materializing a list of every word
+        return {
+            'characters': len(text),
+            'words': text.count(' ') + 1 if text else 0,
+            'sentences': len(_SENT_RE.findall(text))
+        }
+
+    def estimate_reading_time(self, text, wpm=200):
+        """Estimate reading time in minutes."""
+        return self.estimate_reading_time_words(
+            sum(1 for _ in _WORD_RE.finditer(text)), wpm)
+
+    def estimate_reading_time_words(self, word_count, wpm=200):
+        """Estimate reading time in minutes from a word count."""
+        return word_count / wpm
+
+def _chapter_display_stats(chapter):
+    """Clean one chapter and compute its display statistics.
+
+    Top-level so ProcessPoolExecutor workers can pickle it.
+    """
+    processor = MockTextProcessor()
+    clean = processor.clean_text(chapter['content'])
+    stats = processor.get_text_statistics(clean)
+    return stats, clean[:100]
+
+def demonstrate_parsing(file_path):
+    """Parse the sample book and show chapter statistics."""
+    print("\n📖 Parsing book...")
+
+    parser = MockEPUBParser()
+    processor = MockTextProcessor()
+
+    title = os.path.splitext(os.path.basename(file_path))[0]
+    print(f"   Title: {title}")
+
+    chapter_stream = parser.iter_chapters(file_path)
+
+    total_words = 0
+    outline = []  # titles and word counts only; bodies are dropped as we go
+    blocks = []  # one preformatted display block per chapter
+    index = 0
+
+    # Pull chapters through the pool in bounded batches: clean/stats per
+    # chapter are independent CPU work worth fanning out, but handing
+    # the whole generator to executor.map would re-materialize the book
+    # the streaming parser just avoided. Tiny batches stay in-process,
+    # where worker startup would cost more than it saves.
+    with ProcessPoolExecutor() as executor:
+        while True:
+            batch = list(itertools.islice(chapter_stream, 8))
+            if not batch:
+                break
+
+            if len(batch) < 4:
+                results = [_chapter_display_stats(chapter) for chapter in batch]
+            else:
+                results = executor.map(_chapter_display_stats, batch, chunksize=4)
+
+            for chapter, (stats, preview) in zip(batch, results):
+                index += 1
+                # The parser already tokenized each chapter once to count
+                # words; reuse that count here (and in the TTS stage)
+                # instead of paying for a full re-tokenization
+                word_count = chapter['word_count']
+                total_words += word_count
+                outline.append({'title': chapter['title'], 'word_count': word_count})
+
+                blocks.append(
+                    f"\n   {index}. {chapter['title']}\n"
+                    f"      Words: {word_count}\n"
+                    f"      Sentences: {stats['sentences']}\n"
+                    f"      Preview: {preview}...")
+
+    # One write for the whole chapter listing: a print() per detail line
+    # is 4+ syscalls per chapter and the terminal becomes the bottleneck
+    # on books with hundreds of chapters, so long listings also get
+    # truncated to a head and tail
+    if len(blocks) > 20:
+        blocks = blocks[:10] + [f"\n   ... {len(blocks) - 15} more chapters ..."] + blocks[-5:]
+    sys.stdout.write(''.join(blocks) + '\n')
+
+    reading_time = processor.estimate_reading_time_words(total_words)
+    print(f"\n   Chapters: {index}")
+    print(f"   Total words: {total_words}")
+    print(f"   Estimated reading time: {reading_time:.1f} minutes")
+
+    # The TTS walkthrough only needs titles and word counts, so the
+    # returned book keeps just the outline, not the chapter bodies
+    metadata = {'title': title, 'author': 'Unknown Author', 'chapter_count': index}
+    return {'metadata': metadata, 'chapters': outline}
+
+def demonstrate_tts_process(book_data):
+    """Walk through what the real TTS stage would do, without audio."""
+    print("\n🎤 Simulating text-to-speech conversion...")
+
+    # Rough CPU synthesis estimate: ~10 words per second. Emitted as one
+    # write, truncated like the parsing listing, for the same I/O reason.
+    lines = [
+        f"   Chapter {i}: {chapter['title']}\n"
+        f"      ~{chapter['word_count'] / 10.0:.0f}s to synthesize"
+        f" ({chapter['word_count']} words)"
+        for i, chapter in enumerate(book_data['chapters'], 1)
+    ]
+    if len(lines) > 20:
+        lines = lines[:10] + [f"   ... {len(lines) - 15} more chapters ..."] + lines[-5:]
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+    print("\n   (install the full requirements to generate real audio)")
+
+def check_ffmpeg():
+    """Check if FFmpeg is available for audio processing."""
+    try:
+        # A hung/broken ffmpeg shim would otherwise stall the demo
+        # forever; printing a version banner should take milliseconds
+        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True,
+                       timeout=2.0)
+        print("\n✅ FFmpeg is available")
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        print("\n❌ FFmpeg not found (needed for the real audio pipeline)")
+        return False
+
+def main():
+    print("🎧 EPUB to Audiobook Converter - Simplified Demo")
+    print(_BAR60)
+
+    # Find something to parse: one scandir of ./input replaces a stat()
+    # per guessed filename and picks up any sample dropped in there
+    input_file = None
+    if os.path.isdir('input'):
+        with os.scandir('input') as it:
+            candidates = sorted(
+                entry.path for entry in it
+                if entry.is_file() and entry.name.lower().endswith(('.epub', '.txt')))
+        if candidates:
+            input_file = candidates[0]
+
+    if input_file is None:
+        for fallback in ('sample_book.txt', 'README.md'):
+            if os.path.isfile(fallback):
+                input_file = fallback
+                break
+
+    if not input_file:
+        print("❌ No sample file found. Add a .txt file to ./input and retry.")
+        return
+
+    print(f"📄 Using sample file: {input_file}")
+
+    book_data = demonstrate_parsing(input_file)
+    demonstrate_tts_process(book_data)
+    check_ffmpeg()
+
+    print("\n✅ Demo complete!")
+    print("   Run 'python main.py --help' for the real converter.")
+
+if __name__ == "__main__":
+    main()
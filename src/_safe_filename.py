@@ -0,0 +1,27 @@
+"""
+Shared Filename Sanitization
+
+One place for the character whitelist used when book and chapter titles
+become filenames, so the audio and TTS modules can't drift apart.
+"""
+
+import re
+
+# Anything outside the filename whitelist; a single compiled-regex sub
+# removes it in one C-level sweep
+_UNSAFE_RE = re.compile(r'[^A-Za-z0-9\-_. ]')
+
+def sanitize(title: str, maxlen: int = 50, default: str = "chapter") -> str:
+    """
+    Reduce a title to a filesystem-safe fragment.
+
+    Args:
+        title (str): Raw title text
+        maxlen (int): Maximum length of the fragment
+        default (str): Returned when nothing safe survives
+
+    Returns:
+        str: Sanitized fragment
+    """
+    safe = _UNSAFE_RE.sub('', title).replace(' ', '_')[:maxlen].strip('.-_')
+    return safe or default
@@ -11,11 +11,13 @@ import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-try:
-    import pyttsx3
-    PYTTSX3_AVAILABLE = True
-except ImportError:
-    PYTTSX3_AVAILABLE = False
+import importlib.util
+
+# Probe availability from finder metadata only; the real import (which
+# touches the platform speech APIs) is deferred to engine construction
+PYTTSX3_AVAILABLE = importlib.util.find_spec("pyttsx3") is not None
+
+from ._safe_filename import sanitize
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +26,20 @@ class AlternativeTTSEngine:
     Fallback TTS engine using pyttsx3 for Python 3.13 compatibility.
     Lower quality than Coqui-TTS but functional for testing.
     """
-    
+
+    # Resolved voice id per configured voice, shared across instances:
+    # enumerating voices goes through the platform speech API and is
+    # slow, so batch mode shouldn't repeat it per engine construction
+    _voice_cache: Dict[str, Optional[str]] = {}
+
     def __init__(self, config: Dict[str, Any]):
         if not PYTTSX3_AVAILABLE:
             raise ImportError("pyttsx3 is not available. Install with: pip install pyttsx3")
-        
+
+        import pyttsx3
+
         self.config = config
-        
+
         # Initialize pyttsx3 engine with error handling
         try:
             self.engine = pyttsx3.init()
@@ -47,63 +56,99 @@ class AlternativeTTSEngine:
             rate = self.engine.getProperty('rate')
             self.engine.setProperty('rate', int(rate * self.speed))
             
-            # Try to set voice
-            voices = self.engine.getProperty('voices')
-            if voices and len(voices) > 0:
-                # Use first available voice, or try to find English voice
-                selected_voice = voices[0]
-                for voice in voices:
-                    if 'english' in voice.name.lower() or 'en' in voice.id.lower():
-                        selected_voice = voice
-                        break
-                self.engine.setProperty('voice', selected_voice.id)
-                logger.info(f"Using voice: {selected_voice.name}")
+            # Try to set voice; the resolved id is cached at class level
+            # so repeated constructions skip the voice enumeration
+            voice_key = config.get('voice', 'en')
+            voice_id = self._voice_cache.get(voice_key)
+            if voice_id is None:
+                voices = self.engine.getProperty('voices')
+                if voices:
+                    # Use first available voice, or try to find English voice
+                    voice_id = next(
+                        (v.id for v in voices
+                         if 'english' in v.name.lower() or 'en' in v.id.lower()),
+                        voices[0].id)
+                self._voice_cache[voice_key] = voice_id
+            if voice_id:
+                self.engine.setProperty('voice', voice_id)
+                logger.info(f"Using voice: {voice_id}")
         except Exception as e:
             logger.warning(f"Could not configure voice settings: {e}")
         
         logger.info("Alternative TTS Engine initialized (pyttsx3)")
         logger.warning("Using fallback TTS engine. Quality may be lower than Coqui-TTS.")
     
-    def text_to_speech(self, text: str, chapter_title: str, output_dir: str, 
+    def text_to_speech(self, text: str, chapter_title: str, output_dir: str,
                       chapter_num: int) -> Optional[str]:
         """
         Convert text to speech and save as audio file.
         """
+        results = self.text_to_speech_batch(
+            [(text, chapter_title, chapter_num)], output_dir)
+        return results[0] if results else None
+
+    def text_to_speech_batch(self, items: List[tuple],
+                             output_dir: str) -> List[Optional[str]]:
+        """
+        Convert several chapters to speech in one engine session.
+
+        Queues every chapter with save_to_file and calls runAndWait
+        exactly once: the SAPI/NSSpeechSynthesizer event loop spin-up
+        that runAndWait pays is per call, not per utterance, so for many
+        short chapters one shared session roughly halves total TTS time.
+
+        Args:
+            items: List of (text, chapter_title, chapter_num) tuples
+            output_dir (str): Directory for the generated WAV files
+
+        Returns:
+            List[Optional[str]]: Output path per item, None where skipped/failed
+        """
+        results: List[Optional[str]] = [None] * len(items)
+        queued = []
+
+        # Bound once: each of these is two dict lookups per iteration
+        # in a loop that runs for every chapter in the book
+        make_safe = self._create_safe_filename
+        save_to_file = self.engine.save_to_file
+        join = os.path.join
+
         try:
-            if not text.strip():
-                logger.warning(f"Empty text for chapter {chapter_num}")
-                return None
-            
-            # Create safe filename
-            safe_title = self._create_safe_filename(chapter_title)
-            output_filename = f"chapter_{chapter_num:03d}_{safe_title}.wav"
-            output_path = os.path.join(output_dir, output_filename)
-            
-            logger.info(f"Generating audio for chapter {chapter_num}: {chapter_title}")
-            
-            # Save to file
-            self.engine.save_to_file(text, output_path)
-            self.engine.runAndWait()
-            
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path) / 1024  # KB
-                logger.info(f"Generated audio file: {output_path} ({file_size:.1f} KB)")
-                return output_path
-            else:
-                logger.error(f"Failed to generate audio file: {output_path}")
-                return None
-                
+            for index, (text, chapter_title, chapter_num) in enumerate(items):
+                if not text.strip():
+                    logger.warning("Empty text for chapter %s", chapter_num)
+                    continue
+
+                # Create safe filename
+                safe_title = make_safe(chapter_title)
+                output_filename = f"chapter_{chapter_num:03d}_{safe_title}.wav"
+                output_path = join(output_dir, output_filename)
+
+                logger.info("Generating audio for chapter %s: %s", chapter_num, chapter_title)
+                save_to_file(text, output_path)
+                queued.append((index, chapter_num, output_path))
+
+            if queued:
+                # One event-loop run drains the whole queue
+                self.engine.runAndWait()
+
+            for index, chapter_num, output_path in queued:
+                if os.path.exists(output_path):
+                    file_size = os.path.getsize(output_path) / 1024  # KB
+                    logger.info("Generated audio file: %s (%.1f KB)", output_path, file_size)
+                    results[index] = output_path
+                else:
+                    logger.error("Failed to generate audio file: %s", output_path)
+
+            return results
+
         except Exception as e:
-            logger.error(f"Error generating audio for chapter {chapter_num}: {str(e)}")
-            return None
+            logger.error(f"Error generating audio batch: {str(e)}")
+            return results
     
     def _create_safe_filename(self, title: str) -> str:
         """Create a safe filename from chapter title."""
-        safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_. "
-        safe_title = ''.join(c for c in title if c in safe_chars)
-        safe_title = safe_title.replace(' ', '_')[:50]
-        safe_title = safe_title.strip('.-_')
-        return safe_title or "chapter"
+        return sanitize(title)
     
     def get_available_voices(self) -> List[str]:
         """Get list of available voices."""
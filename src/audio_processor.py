@@ -6,16 +6,20 @@ Handles audio file processing, merging, and metadata management.
 
 import os
 import logging
+import shutil
+import subprocess
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import datetime
 
-from pydub import AudioSegment
-from mutagen.mp4 import MP4, MP4Cover
-from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TCON, APIC, CHAP, CTOC
-from mutagen.mp3 import MP3
-import mutagen
+from ._safe_filename import sanitize
+
+# pydub and mutagen are imported inside the methods that need them:
+# importing pydub probes for ffmpeg and mutagen builds its tag classes,
+# costs that would otherwise land on every CLI startup (including
+# --help) just for having this module on the import path
 
 logger = logging.getLogger(__name__)
 
@@ -48,10 +52,54 @@ class AudioProcessor:
             }
         }
         
+        # Chapter durations in ms, keyed by path; filled on first probe so
+        # chapterization never decodes a file a second time
+        self._duration_cache: Dict[str, float] = {}
+
+        # Silent chapter-pause segment, built lazily and reused across
+        # merges (batch mode) as long as the frame layout matches
+        self._pause = None
+
+        # Fallback release year for tags, computed once instead of a
+        # datetime.now() call per tag write
+        self._year = str(datetime.datetime.now().year)
+
         logger.info(f"Audio processor initialized for {self.output_format} format")
     
+    def _pause_segment(self, frame_rate: int, channels: int, sample_width: int):
+        """Chapter pause in the given frame layout, cached across merges.
+
+        Generating silence allocates a zero-filled PCM buffer; building
+        it in the chapters' own layout also means concatenation never
+        triggers an implicit resample. The cached segment is rebuilt
+        only when the layout changes.
+        """
+        pause = self._pause
+        if (pause is None
+                or pause.frame_rate != frame_rate
+                or pause.channels != channels
+                or pause.sample_width != sample_width):
+            from pydub import AudioSegment
+            pause = (AudioSegment
+                     .silent(duration=int(self.chapter_pause), frame_rate=frame_rate)
+                     .set_channels(channels)
+                     .set_sample_width(sample_width))
+            self._pause = pause
+        return pause
+
+    def _mp4_temp_path(self, output_path: str) -> str:
+        """Temp .mp4 path for an .m4b target, touching only the suffix.
+
+        str.replace('.m4b', '.mp4') would also rewrite an '.m4b'
+        occurring earlier in the path (e.g. a directory name) and
+        scans the whole string to find it.
+        """
+        if output_path.endswith('.m4b'):
+            return output_path[:-4] + '.mp4'
+        return output_path + '.mp4'
+
     def merge_audiobook(self, audio_files: List[Dict[str, Any]], 
-                       book_data: Dict[str, Any], output_dir: str) -> Optional[str]:
+                       book_data: Dict[str, Any], output_dir: str) -> Optional[tuple]:
         """
         Merge individual chapter audio files into a complete audiobook.
         
@@ -61,7 +109,7 @@ class AudioProcessor:
             output_dir (str): Output directory for final audiobook
             
         Returns:
-            str: Path to final audiobook file or None if failed
+            tuple: (path to final audiobook file, size in bytes) or None if failed
         """
         try:
             logger.info("Starting audiobook merge process...")
@@ -75,15 +123,26 @@ class AudioProcessor:
             
             # Merge audio files
             logger.info(f"Merging {len(sorted_files)} audio files...")
-            merged_audio = self._merge_audio_files(sorted_files)
-            
-            if not merged_audio:
-                logger.error("Failed to merge audio files")
-                return None
-            
-            # Export in the specified format
-            temp_path = self._export_audio(merged_audio, output_path)
-            
+
+            # Fast path: one ffmpeg concat+encode pass instead of decoding
+            # every chapter through pydub and re-encoding the whole book
+            temp_path = self._merge_with_ffmpeg(sorted_files, output_path)
+
+            # Next best: decode chapters one at a time and pipe the PCM
+            # straight into the encoder, so RSS stays at one chapter
+            if not temp_path:
+                temp_path = self._pipe_encode(sorted_files, output_path)
+
+            if not temp_path:
+                merged_audio = self._merge_audio_files(sorted_files)
+
+                if not merged_audio:
+                    logger.error("Failed to merge audio files")
+                    return None
+
+                # Export in the specified format
+                temp_path = self._export_audio(merged_audio, output_path)
+
             if not temp_path:
                 logger.error("Failed to export merged audio")
                 return None
@@ -101,9 +160,9 @@ class AudioProcessor:
                     pass
             
             if final_path and os.path.exists(final_path):
-                file_size = os.path.getsize(final_path) / (1024 * 1024)  # MB
-                logger.info(f"Audiobook created successfully: {final_path} ({file_size:.2f} MB)")
-                return final_path
+                byte_count = os.path.getsize(final_path)
+                logger.info(f"Audiobook created successfully: {final_path} ({byte_count / (1024 * 1024):.2f} MB)")
+                return final_path, byte_count
             else:
                 logger.error("Failed to create final audiobook file")
                 return None
@@ -112,40 +171,336 @@ class AudioProcessor:
             logger.error(f"Error merging audiobook: {str(e)}")
             return None
     
-    def _merge_audio_files(self, audio_files: List[Dict[str, Any]]) -> Optional[AudioSegment]:
+    def stream_audiobook(self, waveforms, book_data: Dict[str, Any],
+                         output_dir: str, sample_rate: int) -> Optional[tuple]:
+        """
+        Mux synthesized chapters straight into the final audiobook file.
+
+        Consumes (chapter_num, title, waveform) tuples and pipes them as
+        16-bit PCM into a single ffmpeg process that encodes the target
+        container on the fly. Chapter audio is never written to disk as
+        WAV and read back, which halves the disk bytes moved for a large
+        book. Requires ffmpeg on PATH.
+
+        Args:
+            waveforms: Iterable of (chapter_num, title, waveform) tuples
+            book_data (Dict): Book metadata and information
+            output_dir (str): Output directory for final audiobook
+            sample_rate (int): Sample rate of the incoming waveforms
+
+        Returns:
+            tuple: (path to final audiobook file, size in bytes) or None if failed
+        """
+        if not shutil.which('ffmpeg'):
+            logger.error("Streaming output requires ffmpeg on PATH")
+            return None
+
+        import numpy as np
+
+        try:
+            output_filename = self._create_output_filename(book_data)
+            output_path = os.path.join(output_dir, output_filename)
+
+            format_info = self.format_settings[self.output_format]
+            bitrate = format_info['parameters']['bitrate']
+
+            if self.output_format == 'm4b':
+                target = self._mp4_temp_path(output_path)
+                codec = 'aac'
+            else:
+                target = output_path
+                codec = 'libmp3lame'
+
+            pause_frames = int(sample_rate * self.chapter_pause / 1000.0)
+            pause_bytes = b'\x00\x00' * pause_frames
+
+            proc = subprocess.Popen(
+                ['ffmpeg', '-y', '-loglevel', 'error',
+                 '-f', 's16le', '-ar', str(sample_rate), '-ac', '1',
+                 '-i', 'pipe:0',
+                 '-c:a', codec, '-b:a', bitrate, target],
+                stdin=subprocess.PIPE)
+
+            chapter_titles = []
+            try:
+                for chapter_num, title, wav in waveforms:
+                    if chapter_titles:
+                        proc.stdin.write(pause_bytes)
+
+                    pcm = (np.clip(wav, -1.0, 1.0) * 32767).astype('<i2')
+                    proc.stdin.write(pcm.tobytes())
+                    chapter_titles.append(title)
+            finally:
+                proc.stdin.close()
+                proc.wait()
+
+            if proc.returncode != 0 or not chapter_titles:
+                logger.error("ffmpeg streaming mux failed")
+                return None
+
+            # Add metadata and chapters
+            final_path = self._add_metadata_and_chapters(
+                target, output_path, book_data, []
+            )
+
+            # The merge path records the chapter list as a comment tag;
+            # do the same from the titles collected while streaming
+            if final_path and self.output_format == 'm4b':
+                try:
+                    from mutagen.mp4 import MP4
+                    audiobook = MP4(final_path)
+                    audiobook['©cmt'] = '; '.join(
+                        f"Chapter {i+1}: {title}"
+                        for i, title in enumerate(chapter_titles))
+                    audiobook.save()
+                except Exception as e:
+                    logger.warning(f"Could not add chapter list: {str(e)}")
+
+            if final_path and os.path.exists(final_path):
+                byte_count = os.path.getsize(final_path)
+                logger.info(f"Audiobook created successfully: {final_path} ({byte_count / (1024 * 1024):.2f} MB)")
+                return final_path, byte_count
+            else:
+                logger.error("Failed to create final audiobook file")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error streaming audiobook: {str(e)}")
+            return None
+
+    def _merge_with_ffmpeg(self, audio_files: List[Dict[str, Any]],
+                           output_path: str) -> Optional[str]:
+        """Merge and encode all chapters in one ffmpeg concat-demuxer pass.
+
+        The chapter WAVs always need a transcode to AAC/MP3, so this runs
+        a single encode over the concat list (with a generated silence
+        file providing the chapter pause) instead of pydub's
+        decode-everything-into-RAM approach. Returns the encoded file
+        path, or None to fall back to the pydub path.
+        """
+        if not (shutil.which('ffmpeg') and shutil.which('ffprobe')):
+            return None
+
+        try:
+            format_info = self.format_settings[self.output_format]
+            bitrate = format_info['parameters']['bitrate']
+
+            if self.output_format == 'm4b':
+                target = self._mp4_temp_path(output_path)
+                codec = 'aac'
+            else:
+                target = output_path
+                codec = 'libmp3lame'
+
+            pause_seconds = self.chapter_pause / 1000.0
+            temp_dir = tempfile.mkdtemp()
+
+            try:
+                # Generate the chapter pause at the chapters' sample rate
+                silence_path = None
+                if pause_seconds > 0:
+                    probe = subprocess.run(
+                        ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+                         '-show_entries', 'stream=sample_rate', '-of', 'csv=p=0',
+                         audio_files[0]['file']],
+                        capture_output=True, text=True, check=True)
+                    sample_rate = probe.stdout.strip() or '22050'
+
+                    silence_path = os.path.join(temp_dir, 'pause.wav')
+                    subprocess.run(
+                        ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi',
+                         '-i', f'anullsrc=r={sample_rate}:cl=mono',
+                         '-t', f'{pause_seconds:.3f}', silence_path],
+                        check=True)
+
+                concat_path = os.path.join(temp_dir, 'concat.txt')
+                first_written = False
+                with open(concat_path, 'w', encoding='utf-8') as f:
+                    for audio_info in audio_files:
+                        audio_file = audio_info['file']
+                        if not os.path.exists(audio_file):
+                            logger.warning("Audio file not found, skipping: %s", audio_file)
+                            continue
+                        if first_written and silence_path:
+                            f.write(f"file '{silence_path}'\n")
+                        f.write(f"file '{os.path.abspath(audio_file)}'\n")
+                        first_written = True
+
+                if not first_written:
+                    return None
+
+                subprocess.run(
+                    ['ffmpeg', '-y', '-loglevel', 'error',
+                     '-f', 'concat', '-safe', '0', '-i', concat_path,
+                     '-c:a', codec, '-b:a', bitrate, target],
+                    check=True)
+
+                logger.info("Merged audiobook with single-pass ffmpeg concat")
+                return target
+
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        except Exception as e:
+            logger.warning(f"ffmpeg concat merge failed, falling back to pydub: {str(e)}")
+            return None
+
+    def _pipe_encode(self, audio_files: List[Dict[str, Any]],
+                     output_path: str) -> Optional[str]:
+        """Decode chapters one at a time and pipe raw PCM into ffmpeg.
+
+        Middle tier between the concat fast path and the in-RAM pydub
+        merge: pydub's export spools the whole book's PCM before
+        encoding, so a multi-hour audiobook holds gigabytes in RSS and
+        doubles peak disk. Writing each chapter's raw_data to the
+        encoder's stdin as soon as it is decoded caps memory at one
+        chapter's PCM. Returns the encoded path, or None to fall back.
+        """
+        if not shutil.which('ffmpeg'):
+            return None
+
+        try:
+            from pydub import AudioSegment
+
+            format_info = self.format_settings[self.output_format]
+            bitrate = format_info['parameters']['bitrate']
+
+            if self.output_format == 'm4b':
+                target = self._mp4_temp_path(output_path)
+                codec = 'aac'
+            else:
+                target = output_path
+                codec = 'libmp3lame'
+
+            pcm_formats = {1: 'u8', 2: 's16le', 4: 's32le'}
+
+            proc = None
+            pause_raw = b''
+            frame_rate = channels = sample_width = None
+
+            # Per-chapter loop: hoist the attribute lookups out of it
+            exists = os.path.exists
+            from_wav = AudioSegment.from_wav
+            warn = logger.warning
+
+            try:
+                for audio_info in audio_files:
+                    audio_file = audio_info['file']
+                    if not exists(audio_file):
+                        warn("Audio file not found, skipping: %s", audio_file)
+                        continue
+
+                    try:
+                        segment = from_wav(audio_file)
+                    except Exception as e:
+                        warn("Error loading audio file %s: %s", audio_file, e)
+                        continue
+
+                    self._duration_cache[audio_file] = len(segment)
+
+                    if proc is None:
+                        # The first readable chapter fixes the raw PCM
+                        # layout the encoder is told to expect
+                        frame_rate = segment.frame_rate
+                        channels = segment.channels
+                        sample_width = segment.sample_width
+                        pcm_format = pcm_formats.get(sample_width)
+                        if pcm_format is None:
+                            return None
+
+                        proc = subprocess.Popen(
+                            ['ffmpeg', '-y', '-loglevel', 'error',
+                             '-f', pcm_format, '-ar', str(frame_rate),
+                             '-ac', str(channels), '-i', 'pipe:0',
+                             '-c:a', codec, '-b:a', bitrate, target],
+                            stdin=subprocess.PIPE)
+
+                        pause_raw = self._pause_segment(
+                            frame_rate, channels, sample_width).raw_data
+                    else:
+                        # Later chapters must match the declared layout
+                        if (segment.frame_rate != frame_rate
+                                or segment.channels != channels
+                                or segment.sample_width != sample_width):
+                            segment = (segment.set_frame_rate(frame_rate)
+                                       .set_channels(channels)
+                                       .set_sample_width(sample_width))
+                        proc.stdin.write(pause_raw)
+
+                    proc.stdin.write(segment.raw_data)
+            finally:
+                if proc is not None:
+                    proc.stdin.close()
+                    proc.wait()
+
+            if proc is None or proc.returncode != 0:
+                return None
+
+            logger.info("Merged audiobook by streaming PCM into ffmpeg")
+            return target
+
+        except Exception as e:
+            logger.warning(f"Streaming encode failed, falling back to pydub: {str(e)}")
+            return None
+
+    def _merge_audio_files(self, audio_files: List[Dict[str, Any]]) -> Optional["AudioSegment"]:
         """Merge individual audio files with chapter pauses."""
         try:
+            from pydub import AudioSegment
+
             if not audio_files:
                 return None
-            
-            # Load first audio file
-            first_file = audio_files[0]['file']
-            if not os.path.exists(first_file):
-                logger.error(f"Audio file not found: {first_file}")
-                return None
-            
-            combined_audio = AudioSegment.from_wav(first_file)
-            logger.debug(f"Loaded first file: {first_file}")
-            
-            # Create chapter pause
-            pause = AudioSegment.silent(duration=int(self.chapter_pause))
-            
-            # Merge remaining files
-            for i, audio_info in enumerate(audio_files[1:], 1):
+
+            # Bind the per-file lookups once; load() runs for every
+            # chapter and each dotted access is a dict lookup per call
+            exists = os.path.exists
+            from_wav = AudioSegment.from_wav
+            warn = logger.warning
+
+            def load(audio_info):
                 audio_file = audio_info['file']
-                
-                if not os.path.exists(audio_file):
-                    logger.warning(f"Audio file not found, skipping: {audio_file}")
-                    continue
-                
+                if not exists(audio_file):
+                    warn("Audio file not found, skipping: %s", audio_file)
+                    return None
                 try:
-                    chapter_audio = AudioSegment.from_wav(audio_file)
-                    combined_audio += pause + chapter_audio
-                    logger.debug(f"Merged file {i+1}/{len(audio_files)}: {audio_file}")
+                    chapter_audio = from_wav(audio_file)
                 except Exception as e:
-                    logger.warning(f"Error loading audio file {audio_file}: {str(e)}")
-                    continue
-            
+                    warn("Error loading audio file %s: %s", audio_file, e)
+                    return None
+                # The decode already cost a full read; remember the
+                # duration so chapterization doesn't probe the file again
+                self._duration_cache[audio_file] = len(chapter_audio)
+                return chapter_audio
+
+            # Each decode blocks in its own ffmpeg/file read and releases
+            # the GIL while waiting, so chapters are decoded concurrently;
+            # map() keeps the results in chapter order and the per-file
+            # skip-with-warning semantics live inside load()
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                segments = [s for s in executor.map(load, audio_files) if s is not None]
+
+            if not segments:
+                logger.error("No readable audio files to merge")
+                return None
+
+            # Chapter pause in the chapters' own frame layout so the raw
+            # byte concatenation below needs no resampling
+            first = segments[0]
+            pause = self._pause_segment(
+                first.frame_rate, first.channels, first.sample_width)
+
+            # One allocation for the whole book: += rebuilt the combined
+            # segment's backing bytes every iteration, O(N^2) in audio
+            # bytes; joining raw_data once and re-wrapping via _spawn is
+            # O(N) and keeps peak memory at ~1x the audiobook size
+            pause_raw = pause.raw_data
+            pieces = []
+            for chapter_audio in segments:
+                if pieces:
+                    pieces.append(pause_raw)
+                pieces.append(chapter_audio.raw_data)
+            combined_audio = first._spawn(b''.join(pieces))
+
             logger.info(f"Merged audio duration: {len(combined_audio) / 1000:.1f} seconds")
             return combined_audio
             
@@ -153,14 +508,14 @@ class AudioProcessor:
             logger.error(f"Error merging audio files: {str(e)}")
             return None
     
-    def _export_audio(self, audio: AudioSegment, output_path: str) -> Optional[str]:
+    def _export_audio(self, audio: "AudioSegment", output_path: str) -> Optional[str]:
         """Export audio in the specified format."""
         try:
             format_info = self.format_settings[self.output_format]
             
             # For M4B, we export as MP4 first
             if self.output_format == 'm4b':
-                temp_path = output_path.replace('.m4b', '.mp4')
+                temp_path = self._mp4_temp_path(output_path)
                 audio.export(
                     temp_path,
                     format=format_info['format'],
@@ -202,9 +557,18 @@ class AudioProcessor:
                          audio_files: List[Dict[str, Any]]) -> Optional[str]:
         """Add metadata and chapters to M4B file."""
         try:
-            # Rename temp file to final M4B extension
-            os.rename(temp_path, final_path)
-            
+            from mutagen.mp4 import MP4
+
+            # Move temp file onto the final M4B name. os.replace
+            # overwrites atomically on every platform, where os.rename
+            # raises on Windows if a previous run left the target behind
+            if temp_path != final_path:
+                try:
+                    os.replace(temp_path, final_path)
+                except OSError:
+                    # e.g. temp dir on a different filesystem
+                    shutil.move(temp_path, final_path)
+
             # Load M4B file
             audiobook = MP4(final_path)
             
@@ -212,7 +576,7 @@ class AudioProcessor:
             audiobook['\xa9nam'] = metadata.get('title', 'Unknown Title')
             audiobook['\xa9ART'] = metadata.get('author', 'Unknown Author')
             audiobook['\xa9alb'] = metadata.get('title', 'Unknown Title')
-            audiobook['\xa9day'] = metadata.get('date', str(datetime.datetime.now().year))
+            audiobook['\xa9day'] = metadata.get('date') or self._year
             audiobook['\xa9gen'] = 'Audiobook'
             audiobook['stik'] = [2]  # Audiobook type
             
@@ -232,20 +596,52 @@ class AudioProcessor:
             logger.error(f"Error adding M4B metadata: {str(e)}")
             return final_path
     
-    def _add_m4b_chapters(self, audiobook: MP4, audio_files: List[Dict[str, Any]]):
+    def _probe_duration_ms(self, audio_file: str) -> Optional[float]:
+        """Get an audio file's duration in ms from its header only.
+
+        A full AudioSegment decode reads the entire PCM just to take
+        len(); the WAV header (or an ffprobe format query for anything
+        else) answers the same question in a few hundred bytes. Results
+        are cached per path since the merge and chapterization stages
+        ask about the same files.
+        """
+        duration = self._duration_cache.get(audio_file)
+        if duration is not None:
+            return duration
+
+        try:
+            if audio_file.lower().endswith('.wav'):
+                import wave
+                with wave.open(audio_file, 'rb') as w:
+                    duration = w.getnframes() * 1000.0 / w.getframerate()
+            else:
+                probe = subprocess.run(
+                    ['ffprobe', '-v', 'error', '-show_entries',
+                     'format=duration', '-of', 'csv=p=0', audio_file],
+                    capture_output=True, text=True, check=True)
+                duration = float(probe.stdout.strip()) * 1000.0
+        except Exception as e:
+            logger.warning("Could not probe duration of %s: %s", audio_file, e)
+            return None
+
+        self._duration_cache[audio_file] = duration
+        return duration
+
+    def _add_m4b_chapters(self, audiobook: "MP4", audio_files: List[Dict[str, Any]]):
         """Add chapter markers to M4B file."""
         try:
             # Calculate chapter start times
             current_time = 0
             chapters = []
-            
+
             for audio_info in audio_files:
                 audio_file = audio_info['file']
                 if os.path.exists(audio_file):
-                    # Get duration of audio file
-                    audio = AudioSegment.from_wav(audio_file)
-                    duration = len(audio)  # in milliseconds
-                    
+                    # Duration from the file header, not a second decode
+                    duration = self._probe_duration_ms(audio_file)
+                    if duration is None:
+                        continue
+
                     chapters.append({
                         'title': audio_info['title'],
                         'start_time': current_time,
@@ -270,6 +666,10 @@ class AudioProcessor:
                          audio_files: List[Dict[str, Any]]) -> str:
         """Add metadata to MP3 file."""
         try:
+            import mutagen
+            from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TCON
+            from mutagen.mp3 import MP3
+
             # Load MP3 file
             audiobook = MP3(file_path, ID3=ID3)
             
@@ -279,12 +679,17 @@ class AudioProcessor:
             except mutagen.id3.error:
                 pass  # Tags already exist
             
-            # Add basic metadata
-            audiobook.tags.add(TIT2(encoding=3, text=metadata.get('title', 'Unknown Title')))
-            audiobook.tags.add(TPE1(encoding=3, text=metadata.get('author', 'Unknown Author')))
-            audiobook.tags.add(TALB(encoding=3, text=metadata.get('title', 'Unknown Title')))
-            audiobook.tags.add(TDRC(encoding=3, text=metadata.get('date', str(datetime.datetime.now().year))))
-            audiobook.tags.add(TCON(encoding=3, text='Audiobook'))
+            # Add basic metadata in one bulk update instead of five
+            # separate add() calls (each a hash insert of its own), with
+            # the twice-used title resolved once
+            title = metadata.get('title', 'Unknown Title')
+            audiobook.tags.update({
+                'TIT2': TIT2(encoding=3, text=title),
+                'TPE1': TPE1(encoding=3, text=metadata.get('author', 'Unknown Author')),
+                'TALB': TALB(encoding=3, text=title),
+                'TDRC': TDRC(encoding=3, text=metadata.get('date') or self._year),
+                'TCON': TCON(encoding=3, text='Audiobook'),
+            })
             
             # Save metadata
             audiobook.save()
@@ -302,15 +707,10 @@ class AudioProcessor:
         title = metadata.get('title', 'Unknown_Title')
         author = metadata.get('author', 'Unknown_Author')
         
-        # Create safe filename
-        safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_. "
-        safe_title = ''.join(c for c in title if c in safe_chars).replace(' ', '_')
-        safe_author = ''.join(c for c in author if c in safe_chars).replace(' ', '_')
-        
-        # Limit length
-        safe_title = safe_title[:50]
-        safe_author = safe_author[:30]
-        
+        # Create safe filename via the shared sanitizer
+        safe_title = sanitize(title, 50, default='Unknown_Title')
+        safe_author = sanitize(author, 30, default='Unknown_Author')
+
         # Create filename
         filename = f"{safe_author}-{safe_title}.{self.output_format}"
         
@@ -319,16 +719,29 @@ class AudioProcessor:
     def get_audio_info(self, file_path: str) -> Dict[str, Any]:
         """Get information about an audio file."""
         try:
-            audio = AudioSegment.from_file(file_path)
-            
+            # WAV headers carry everything we report, so read kilobytes
+            # instead of decoding the whole file through pydub
+            if file_path.lower().endswith('.wav'):
+                import wave
+                with wave.open(file_path, 'rb') as w:
+                    duration = w.getnframes() / w.getframerate()
+                    sample_rate = w.getframerate()
+                    channels = w.getnchannels()
+            else:
+                from pydub import AudioSegment
+                audio = AudioSegment.from_file(file_path)
+                duration = len(audio) / 1000
+                sample_rate = audio.frame_rate
+                channels = audio.channels
+
             return {
-                'duration_seconds': len(audio) / 1000,
-                'duration_formatted': self._format_duration(len(audio) / 1000),
-                'sample_rate': audio.frame_rate,
-                'channels': audio.channels,
+                'duration_seconds': duration,
+                'duration_formatted': self._format_duration(duration),
+                'sample_rate': sample_rate,
+                'channels': channels,
                 'file_size_mb': os.path.getsize(file_path) / (1024 * 1024)
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting audio info: {str(e)}")
             return {}
@@ -350,14 +763,32 @@ class AudioProcessor:
             try:
                 if os.path.exists(file_path):
                     os.remove(file_path)
-                    logger.debug(f"Removed temporary file: {file_path}")
+                    logger.debug("Removed temporary file: %s", file_path)
             except Exception as e:
-                logger.warning(f"Could not remove temporary file {file_path}: {str(e)}")
+                logger.warning("Could not remove temporary file %s: %s", file_path, e)
     
     def validate_audio_file(self, file_path: str) -> bool:
-        """Validate if an audio file is readable."""
+        """Validate if an audio file is readable.
+
+        Checks the container header instead of decoding the file: the
+        old AudioSegment.from_file round-trip materialized the entire
+        PCM just to answer a boolean, turning a readability check on a
+        200 MB WAV into a 200 MB decode.
+        """
         try:
-            AudioSegment.from_file(file_path)
-            return True
+            if file_path.lower().endswith('.wav'):
+                with open(file_path, 'rb') as f:
+                    header = f.read(12)
+                return header.startswith(b'RIFF') and header[8:12] == b'WAVE'
+
+            if shutil.which('ffprobe'):
+                return subprocess.run(
+                    ['ffprobe', '-v', 'error', '-show_format', file_path],
+                    capture_output=True).returncode == 0
+
+            # Last resort without ffprobe: mutagen parses tags/headers
+            # only, never the audio payload
+            import mutagen
+            return mutagen.File(file_path) is not None
         except Exception:
             return False
@@ -5,13 +5,165 @@ Handles application configuration and settings management.
 """
 
 import os
+import copy
 import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# orjson parses and serializes several times faster than stdlib json;
+# configs are pure-data dicts so it's a drop-in win when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Default settings template, built once at import. Constructions copy
+# from this instead of re-executing a ~60-key dict literal per instance.
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    # TTS Settings
+    'tts_model': 'tts_models/en/ljspeech/tacotron2-DDC',
+    'voice': 'en',
+    'speaker': 'default',
+    'speed': 1.0,
+    'pitch': 1.0,
+    'gpu_acceleration': False,
+
+    # Audio Settings
+    'output_format': 'm4b',
+    'audio_quality': 'high',  # 'standard' or 'high'
+    'chapter_pause': 2.0,  # seconds
+    'max_chunk_length': 500,  # characters
+
+    # Processing Settings
+    'max_workers': 2,
+    'temp_dir': './temp',
+    'cleanup_temp': True,
+
+    # Text Processing
+    'text_normalization': True,
+    'expand_abbreviations': True,
+    'remove_urls': True,
+    'remove_emails': True,
+
+    # Output Settings
+    'output_dir': './output',
+    'preserve_structure': True,
+    'add_metadata': True,
+    'add_chapters': True,
+    'stream_output': False,  # Pipe PCM straight into the final file (needs ffmpeg)
+
+    # Logging
+    'log_level': 'INFO',
+    'log_file': './logs/app.log',
+    'console_logging': True,
+
+    # Advanced Settings
+    'retry_attempts': 3,
+    'retry_delay': 1.0,
+    'progress_updates': True,
+    'memory_limit': '2GB',
+
+    # Language-specific settings
+    'language_models': {
+        'en': 'tts_models/en/ljspeech/tacotron2-DDC',
+        'es': 'tts_models/es/mai/tacotron2-DDC',
+        'fr': 'tts_models/fr/mai/tacotron2-DDC',
+        'de': 'tts_models/de/mai/tacotron2-DDC',
+        'it': 'tts_models/it/mai/tacotron2-DDC',
+        'pt': 'tts_models/pt/cv/vits',
+        'ru': 'tts_models/ru/cv/vits',
+        'zh': 'tts_models/zh-CN/baker/tacotron2-DDC',
+        'ja': 'tts_models/ja/kokoro/tacotron2-DDC',
+        'ko': 'tts_models/ko/kss/vits',
+        'ar': 'tts_models/ar/cv/vits',
+        'hi': 'tts_models/hi/cv/vits'
+    },
+
+    # Performance tuning
+    'precision': 'fp16',  # 'fp32', 'fp16' (GPU), or 'int8' (CPU)
+    'batch_size': 1,
+    'torch_threads': None,  # Auto-detect
+    'gpu_memory_fraction': 0.8,
+
+    # Quality settings
+    'sample_rate': 22050,
+    'audio_bitrate': {
+        'standard': {'mp3': '128k', 'm4b': '64k'},
+        'high': {'mp3': '192k', 'm4b': '128k'}
+    },
+
+    # Feature flags
+    'enable_noise_reduction': False,
+    'enable_audio_normalization': True,
+    'enable_silence_detection': True,
+    'enable_progress_bar': True
+}
+
+# Accepted spellings of "true" in env vars; a frozenset hashes once
+# instead of scanning a tuple per membership test
+_TRUTHY = frozenset(('true', '1', 'yes', 'on', 'enabled'))
+
+def _str_to_bool(value: str) -> bool:
+    """Convert string to boolean."""
+    return value.lower() in _TRUTHY
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON text with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON text with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+# The sample config is a fixed document, so keep it as the finished
+# bytes: create_sample_config writes it out without building a dict or
+# serializing anything at runtime
+_SAMPLE_CONFIG_JSON = b'''{
+  "_comment": "EPUB to Audiobook Converter Configuration",
+  "_version": "1.0",
+  "tts_settings": {
+    "tts_model": "tts_models/en/ljspeech/tacotron2-DDC",
+    "voice": "en",
+    "speaker": "default",
+    "speed": 1.0,
+    "pitch": 1.0,
+    "gpu_acceleration": false,
+    "_comment": "TTS engine settings. Set gpu_acceleration to true if you have a CUDA-compatible GPU."
+  },
+  "audio_settings": {
+    "output_format": "m4b",
+    "audio_quality": "high",
+    "chapter_pause": 2.0,
+    "_comment": "Audio output settings. Format can be 'mp3' or 'm4b'. Quality can be 'standard' or 'high'."
+  },
+  "processing_settings": {
+    "max_chunk_length": 500,
+    "max_workers": 2,
+    "cleanup_temp": true,
+    "_comment": "Processing optimization settings."
+  },
+  "output_settings": {
+    "output_dir": "./output",
+    "add_metadata": true,
+    "add_chapters": true,
+    "_comment": "Output file settings."
+  },
+  "advanced_settings": {
+    "retry_attempts": 3,
+    "memory_limit": "2GB",
+    "torch_threads": null,
+    "_comment": "Advanced settings for fine-tuning performance."
+  }
+}'''
+
 class ConfigManager:
     """
     Manages application configuration from files and environment variables.
@@ -20,6 +172,10 @@ class ConfigManager:
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file
         self.config = self._load_default_config()
+        # Memoized getter results; these run once per TTS chunk, so
+        # cache them and invalidate whenever the config changes
+        self._model_cache: Dict[str, str] = {}
+        self._bitrate_cache: Dict[str, str] = {}
         
         # Load configuration from file if provided
         if config_file:
@@ -31,84 +187,13 @@ class ConfigManager:
         logger.info("Configuration loaded successfully")
     
     def _load_default_config(self) -> Dict[str, Any]:
-        """Load default configuration settings."""
-        return {
-            # TTS Settings
-            'tts_model': 'tts_models/en/ljspeech/tacotron2-DDC',
-            'voice': 'en',
-            'speaker': 'default',
-            'speed': 1.0,
-            'pitch': 1.0,
-            'gpu_acceleration': False,
-            
-            # Audio Settings
-            'output_format': 'm4b',
-            'audio_quality': 'high',  # 'standard' or 'high'
-            'chapter_pause': 2.0,  # seconds
-            'max_chunk_length': 500,  # characters
-            
-            # Processing Settings
-            'max_workers': 2,
-            'temp_dir': './temp',
-            'cleanup_temp': True,
-            
-            # Text Processing
-            'text_normalization': True,
-            'expand_abbreviations': True,
-            'remove_urls': True,
-            'remove_emails': True,
-            
-            # Output Settings
-            'output_dir': './output',
-            'preserve_structure': True,
-            'add_metadata': True,
-            'add_chapters': True,
-            
-            # Logging
-            'log_level': 'INFO',
-            'log_file': './logs/app.log',
-            'console_logging': True,
-            
-            # Advanced Settings
-            'retry_attempts': 3,
-            'retry_delay': 1.0,
-            'progress_updates': True,
-            'memory_limit': '2GB',
-            
-            # Language-specific settings
-            'language_models': {
-                'en': 'tts_models/en/ljspeech/tacotron2-DDC',
-                'es': 'tts_models/es/mai/tacotron2-DDC',
-                'fr': 'tts_models/fr/mai/tacotron2-DDC',
-                'de': 'tts_models/de/mai/tacotron2-DDC',
-                'it': 'tts_models/it/mai/tacotron2-DDC',
-                'pt': 'tts_models/pt/cv/vits',
-                'ru': 'tts_models/ru/cv/vits',
-                'zh': 'tts_models/zh-CN/baker/tacotron2-DDC',
-                'ja': 'tts_models/ja/kokoro/tacotron2-DDC',
-                'ko': 'tts_models/ko/kss/vits',
-                'ar': 'tts_models/ar/cv/vits',
-                'hi': 'tts_models/hi/cv/vits'
-            },
-            
-            # Performance tuning
-            'batch_size': 1,
-            'torch_threads': None,  # Auto-detect
-            'gpu_memory_fraction': 0.8,
-            
-            # Quality settings
-            'sample_rate': 22050,
-            'audio_bitrate': {
-                'standard': {'mp3': '128k', 'm4b': '64k'},
-                'high': {'mp3': '192k', 'm4b': '128k'}
-            },
-            
-            # Feature flags
-            'enable_noise_reduction': False,
-            'enable_audio_normalization': True,
-            'enable_silence_detection': True,
-            'enable_progress_bar': True
-        }
+        """Load default configuration settings.
+
+        Returns an independent copy of the module-level template so
+        per-instance mutations never bleed into the shared defaults.
+        deepcopy covers the nested dicts (language_models, audio_bitrate).
+        """
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def _load_config_file(self, config_file: str):
         """Load configuration from JSON file."""
@@ -118,7 +203,7 @@ class ConfigManager:
                 return
             
             with open(config_file, 'r', encoding='utf-8') as f:
-                file_config = json.load(f)
+                file_config = _json_loads(f.read())
             
             # Merge with default config
             self.config.update(file_config)
@@ -127,48 +212,46 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Error loading config file: {str(e)}")
     
+    # (env_var, config_key, converter) triples, built once at class
+    # creation; converter is None for plain string pass-through so the
+    # lookup loop needs no per-entry isinstance dispatch
+    _ENV_MAPPINGS = (
+        ('EPUB_TTS_MODEL', 'tts_model', None),
+        ('EPUB_VOICE', 'voice', None),
+        ('EPUB_SPEAKER', 'speaker', None),
+        ('EPUB_SPEED', 'speed', float),
+        ('EPUB_PITCH', 'pitch', float),
+        ('EPUB_GPU', 'gpu_acceleration', _str_to_bool),
+        ('EPUB_FORMAT', 'output_format', None),
+        ('EPUB_QUALITY', 'audio_quality', None),
+        ('EPUB_PAUSE', 'chapter_pause', float),
+        ('EPUB_OUTPUT_DIR', 'output_dir', None),
+        ('EPUB_LOG_LEVEL', 'log_level', None),
+        ('EPUB_MAX_WORKERS', 'max_workers', int),
+        ('EPUB_CLEANUP', 'cleanup_temp', _str_to_bool),
+        ('EPUB_TORCH_THREADS', 'torch_threads', int),
+        ('EPUB_MEMORY_LIMIT', 'memory_limit', None),
+        ('EPUB_BATCH_SIZE', 'batch_size', int),
+        ('EPUB_SAMPLE_RATE', 'sample_rate', int),
+        ('EPUB_GPU_MEMORY', 'gpu_memory_fraction', float),
+    )
+
     def _load_env_config(self):
         """Load configuration from environment variables."""
-        env_mappings = {
-            'EPUB_TTS_MODEL': 'tts_model',
-            'EPUB_VOICE': 'voice',
-            'EPUB_SPEAKER': 'speaker',
-            'EPUB_SPEED': ('speed', float),
-            'EPUB_PITCH': ('pitch', float),
-            'EPUB_GPU': ('gpu_acceleration', self._str_to_bool),
-            'EPUB_FORMAT': 'output_format',
-            'EPUB_QUALITY': 'audio_quality',
-            'EPUB_PAUSE': ('chapter_pause', float),
-            'EPUB_OUTPUT_DIR': 'output_dir',
-            'EPUB_LOG_LEVEL': 'log_level',
-            'EPUB_MAX_WORKERS': ('max_workers', int),
-            'EPUB_CLEANUP': ('cleanup_temp', self._str_to_bool),
-            'EPUB_TORCH_THREADS': ('torch_threads', int),
-            'EPUB_MEMORY_LIMIT': 'memory_limit',
-            'EPUB_BATCH_SIZE': ('batch_size', int),
-            'EPUB_SAMPLE_RATE': ('sample_rate', int),
-            'EPUB_GPU_MEMORY': ('gpu_memory_fraction', float)
-        }
-        
-        for env_var, config_key in env_mappings.items():
-            env_value = os.getenv(env_var)
+        env_get = os.environ.get
+        for env_var, config_key, converter in self._ENV_MAPPINGS:
+            env_value = env_get(env_var)
             if env_value is not None:
                 try:
-                    if isinstance(config_key, tuple):
-                        key, converter = config_key
-                        self.config[key] = converter(env_value)
-                    else:
-                        self.config[config_key] = env_value
-                    
-                    logger.debug(f"Environment override: {env_var} = {env_value}")
-                    
+                    self.config[config_key] = (
+                        converter(env_value) if converter else env_value)
+                    logger.debug("Environment override: %s = %s", env_var, env_value)
+
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid environment value for {env_var}: {env_value} ({str(e)})")
-    
-    def _str_to_bool(self, value: str) -> bool:
-        """Convert string to boolean."""
-        return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
-    
+                    logger.warning("Invalid environment value for %s: %s (%s)",
+                                   env_var, env_value, e)
+
+
     def get_config(self) -> Dict[str, Any]:
         """Get the complete configuration dictionary."""
         return self.config.copy()
@@ -180,12 +263,19 @@ class ConfigManager:
     def set(self, key: str, value: Any):
         """Set a configuration value."""
         self.config[key] = value
-        logger.debug(f"Configuration updated: {key} = {value}")
-    
+        self._invalidate_caches()
+        logger.debug("Configuration updated: %s = %s", key, value)
+
     def update(self, updates: Dict[str, Any]):
         """Update multiple configuration values."""
         self.config.update(updates)
-        logger.debug(f"Configuration updated with {len(updates)} values")
+        self._invalidate_caches()
+        logger.debug("Configuration updated with %d values", len(updates))
+
+    def _invalidate_caches(self):
+        """Drop memoized getter results after a config change."""
+        self._model_cache.clear()
+        self._bitrate_cache.clear()
     
     def save_config(self, output_file: str):
         """Save current configuration to a JSON file."""
@@ -194,35 +284,44 @@ class ConfigManager:
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+                f.write(_json_dumps(self.config))
             
             logger.info(f"Configuration saved to: {output_file}")
             
         except Exception as e:
             logger.error(f"Error saving config file: {str(e)}")
     
+    # Allowed values for the enumerated settings; frozensets give O(1)
+    # membership tests and are built once at class creation
+    _FORMATS = frozenset(('mp3', 'm4b'))
+    _QUALITIES = frozenset(('standard', 'high'))
+    _LEVELS = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR'))
+
+    _REQUIRED_KEYS = ('voice', 'output_format', 'output_dir')
+
+    # (key, validator, message) triples, built once instead of a fresh
+    # list of lambdas per validate_config call
+    _VALIDATIONS = (
+        ('speed', lambda x: 0.1 <= x <= 3.0, "Speed must be between 0.1 and 3.0"),
+        ('pitch', lambda x: 0.1 <= x <= 3.0, "Pitch must be between 0.1 and 3.0"),
+        ('chapter_pause', lambda x: 0.0 <= x <= 10.0, "Chapter pause must be between 0.0 and 10.0"),
+        ('max_workers', lambda x: 1 <= x <= 16, "Max workers must be between 1 and 16"),
+        ('output_format', _FORMATS.__contains__, "Output format must be 'mp3' or 'm4b'"),
+        ('audio_quality', _QUALITIES.__contains__, "Audio quality must be 'standard' or 'high'"),
+        ('log_level', _LEVELS.__contains__, "Invalid log level")
+    )
+
     def validate_config(self) -> bool:
         """Validate the current configuration."""
         try:
             # Validate required settings
-            required_keys = ['voice', 'output_format', 'output_dir']
-            for key in required_keys:
+            for key in self._REQUIRED_KEYS:
                 if key not in self.config:
                     logger.error(f"Required configuration key missing: {key}")
                     return False
-            
+
             # Validate value ranges
-            validations = [
-                ('speed', lambda x: 0.1 <= x <= 3.0, "Speed must be between 0.1 and 3.0"),
-                ('pitch', lambda x: 0.1 <= x <= 3.0, "Pitch must be between 0.1 and 3.0"),
-                ('chapter_pause', lambda x: 0.0 <= x <= 10.0, "Chapter pause must be between 0.0 and 10.0"),
-                ('max_workers', lambda x: 1 <= x <= 16, "Max workers must be between 1 and 16"),
-                ('output_format', lambda x: x in ['mp3', 'm4b'], "Output format must be 'mp3' or 'm4b'"),
-                ('audio_quality', lambda x: x in ['standard', 'high'], "Audio quality must be 'standard' or 'high'"),
-                ('log_level', lambda x: x in ['DEBUG', 'INFO', 'WARNING', 'ERROR'], "Invalid log level")
-            ]
-            
-            for key, validator, message in validations:
+            for key, validator, message in self._VALIDATIONS:
                 if key in self.config:
                     if not validator(self.config[key]):
                         logger.error(f"Configuration validation failed: {message}")
@@ -244,81 +343,46 @@ class ConfigManager:
             logger.error(f"Error validating configuration: {str(e)}")
             return False
     
+    # Fallback bitrates when the config carries no audio_bitrate table
+    _BITRATE_DEFAULTS = {
+        'mp3': {'standard': '128k', 'high': '192k'},
+        'm4b': {'standard': '64k', 'high': '128k'}
+    }
+
     def get_model_for_language(self, language: str) -> str:
         """Get the TTS model for a specific language."""
-        language_models = self.config.get('language_models', {})
-        return language_models.get(language.lower(), self.config.get('tts_model'))
-    
+        key = language.lower()
+        model = self._model_cache.get(key)
+        if model is None:
+            language_models = self.config.get('language_models', {})
+            model = language_models.get(key, self.config.get('tts_model'))
+            self._model_cache[key] = model
+        return model
+
     def get_audio_bitrate(self, format_type: str) -> str:
         """Get audio bitrate for a specific format and quality."""
-        quality = self.config.get('audio_quality', 'high')
-        bitrates = self.config.get('audio_bitrate', {})
-        
-        if quality in bitrates and format_type in bitrates[quality]:
-            return bitrates[quality][format_type]
-        
-        # Fallback defaults
-        defaults = {
-            'mp3': {'standard': '128k', 'high': '192k'},
-            'm4b': {'standard': '64k', 'high': '128k'}
-        }
-        
-        return defaults.get(format_type, {}).get(quality, '128k')
+        bitrate = self._bitrate_cache.get(format_type)
+        if bitrate is None:
+            quality = self.config.get('audio_quality', 'high')
+            bitrates = self.config.get('audio_bitrate', {})
+
+            if quality in bitrates and format_type in bitrates[quality]:
+                bitrate = bitrates[quality][format_type]
+            else:
+                bitrate = self._BITRATE_DEFAULTS.get(format_type, {}).get(quality, '128k')
+
+            self._bitrate_cache[format_type] = bitrate
+        return bitrate
     
     def create_sample_config(self, output_file: str):
         """Create a sample configuration file with comments."""
-        sample_config = {
-            "_comment": "EPUB to Audiobook Converter Configuration",
-            "_version": "1.0",
-            
-            "tts_settings": {
-                "tts_model": "tts_models/en/ljspeech/tacotron2-DDC",
-                "voice": "en",
-                "speaker": "default",
-                "speed": 1.0,
-                "pitch": 1.0,
-                "gpu_acceleration": False,
-                "_comment": "TTS engine settings. Set gpu_acceleration to true if you have a CUDA-compatible GPU."
-            },
-            
-            "audio_settings": {
-                "output_format": "m4b",
-                "audio_quality": "high",
-                "chapter_pause": 2.0,
-                "_comment": "Audio output settings. Format can be 'mp3' or 'm4b'. Quality can be 'standard' or 'high'."
-            },
-            
-            "processing_settings": {
-                "max_chunk_length": 500,
-                "max_workers": 2,
-                "cleanup_temp": True,
-                "_comment": "Processing optimization settings."
-            },
-            
-            "output_settings": {
-                "output_dir": "./output",
-                "add_metadata": True,
-                "add_chapters": True,
-                "_comment": "Output file settings."
-            },
-            
-            "advanced_settings": {
-                "retry_attempts": 3,
-                "memory_limit": "2GB",
-                "torch_threads": None,
-                "_comment": "Advanced settings for fine-tuning performance."
-            }
-        }
-        
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(sample_config, f, indent=2, ensure_ascii=False)
-            
+            Path(output_file).write_bytes(_SAMPLE_CONFIG_JSON)
             logger.info(f"Sample configuration created: {output_file}")
-            
-        except Exception as e:
+
+        except OSError as e:
             logger.error(f"Error creating sample config: {str(e)}")
     
     def __str__(self) -> str:
         """String representation of the configuration."""
-        return json.dumps(self.config, indent=2, default=str)
+        return _json_dumps(self.config)
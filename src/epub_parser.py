@@ -5,8 +5,11 @@ Handles parsing of EPUB files to extract text content and metadata.
 """
 
 import os
+import re
 import zipfile
 import logging
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -14,6 +17,23 @@ import ebooklib
 from ebooklib import epub
 from bs4 import BeautifulSoup
 
+# lxml is several times faster than BeautifulSoup over html.parser and
+# strips script/style in one C pass; it is in requirements.txt but the
+# stdlib-backed soup path stays as a fallback for environments where
+# the binary wheel didn't install
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Any run of whitespace collapses to one space in a single C-level sweep
+_WS_RE = re.compile(r'\s+')
+
+# Tags that can carry a chapter title, checked during one DOM walk
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
 logger = logging.getLogger(__name__)
 
 class EPUBParser:
@@ -23,6 +43,9 @@ class EPUBParser:
     
     def __init__(self):
         self.supported_formats = ['.epub']
+        # Validation verdicts keyed by (path, mtime, size); CLI flows
+        # validate the same file more than once per run
+        self._validation_cache: Dict[tuple, bool] = {}
     
     def parse_epub(self, epub_path: str) -> Dict[str, Any]:
         """
@@ -48,13 +71,12 @@ class EPUBParser:
             # Extract chapters
             chapters = self._extract_chapters(book)
             
-            # Get cover image if available
-            cover_image = self._extract_cover_image(book)
-            
             book_data = {
                 'metadata': metadata,
                 'chapters': chapters,
-                'cover_image': cover_image,
+                # Covers can run to several MB and most flows never use
+                # them; fetch on demand via get_cover_image instead
+                'cover_image': None,
                 'total_chapters': len(chapters),
                 'file_path': epub_path
             }
@@ -71,104 +93,222 @@ class EPUBParser:
     def _validate_epub_file(self, epub_path: str) -> bool:
         """Validate if the file is a proper EPUB file."""
         try:
-            if not os.path.exists(epub_path):
-                return False
-            
             if not epub_path.lower().endswith('.epub'):
                 return False
-            
-            # Try to open as zip file (EPUB is essentially a zip)
+
+            # stat doubles as the existence check and keys the cache so
+            # an edited file is re-validated
+            stat = os.stat(epub_path)
+            cache_key = (epub_path, stat.st_mtime_ns, stat.st_size)
+            verdict = self._validation_cache.get(cache_key)
+            if verdict is not None:
+                return verdict
+
+            # Try to open as zip file (EPUB is essentially a zip);
+            # compare the mimetype bytes directly - no decode, no strip
+            verdict = False
             with zipfile.ZipFile(epub_path, 'r') as zip_file:
-                # Check for mimetype file
                 if 'mimetype' in zip_file.namelist():
-                    mimetype = zip_file.read('mimetype').decode('utf-8').strip()
-                    return mimetype == 'application/epub+zip'
-            
-            return False
-            
+                    verdict = zip_file.read('mimetype')[:20].startswith(
+                        b'application/epub+zip')
+
+            self._validation_cache[cache_key] = verdict
+            return verdict
+
         except Exception:
             return False
     
+    # (metadata key, DC field, default) - walked once per book so each
+    # field costs a single get_metadata call instead of two
+    _DC_FIELDS = (
+        ('title', 'title', 'Unknown Title'),
+        ('author', 'creator', 'Unknown Author'),
+        ('language', 'language', 'en'),
+        ('publisher', 'publisher', ''),
+        ('date', 'date', ''),
+        ('description', 'description', ''),
+        ('subject', 'subject', ''),
+    )
+
     def _extract_metadata(self, book: epub.EpubBook) -> Dict[str, str]:
         """Extract metadata from EPUB book."""
         metadata = {}
-        
+
         try:
-            # Basic metadata
-            metadata['title'] = book.get_metadata('DC', 'title')[0][0] if book.get_metadata('DC', 'title') else 'Unknown Title'
-            metadata['author'] = book.get_metadata('DC', 'creator')[0][0] if book.get_metadata('DC', 'creator') else 'Unknown Author'
-            metadata['language'] = book.get_metadata('DC', 'language')[0][0] if book.get_metadata('DC', 'language') else 'en'
-            metadata['publisher'] = book.get_metadata('DC', 'publisher')[0][0] if book.get_metadata('DC', 'publisher') else ''
-            metadata['date'] = book.get_metadata('DC', 'date')[0][0] if book.get_metadata('DC', 'date') else ''
-            metadata['description'] = book.get_metadata('DC', 'description')[0][0] if book.get_metadata('DC', 'description') else ''
-            metadata['subject'] = book.get_metadata('DC', 'subject')[0][0] if book.get_metadata('DC', 'subject') else ''
-            
-            # Clean up metadata
-            for key, value in metadata.items():
-                if isinstance(value, str):
-                    metadata[key] = value.strip()
-            
+            for key, field, default in self._DC_FIELDS:
+                entries = book.get_metadata('DC', field)
+                value = entries[0][0] if entries else default
+                metadata[key] = value.strip() if isinstance(value, str) else value
+
         except Exception as e:
             logger.warning(f"Error extracting some metadata: {str(e)}")
-        
+
         return metadata
     
     def _extract_chapters(self, book: epub.EpubBook) -> List[Dict[str, Any]]:
-        """Extract chapters from EPUB book in correct order."""
-        chapters = []
-        
+        """Extract chapters from EPUB book in correct order.
+
+        Spine items are independent and HTML parsing spends most of its
+        time in C code that releases the GIL (especially with lxml), so
+        they are parsed on a thread pool. executor.map preserves spine
+        order, and chapter numbers are assigned in the ordered pass after
+        empty items have been filtered out.
+        """
+        try:
+            spine_items = [item_id for item_id, linear in book.spine
+                           if linear == 'yes']
+
+            # Materialize the items up front, via one id->item dict:
+            # get_item_with_id is a linear scan in ebooklib, so per-entry
+            # lookups would be O(N^2), and the shared book object
+            # shouldn't be touched from worker threads anyway
+            items_by_id = {it.get_id(): it for it in book.get_items()}
+            items = [items_by_id.get(item_id) for item_id in spine_items]
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                parsed = executor.map(self._parse_spine_item, items, spine_items)
+
+                chapters = []
+                chapter_num = 1
+                for chapter in parsed:
+                    if chapter:
+                        self._number_chapter(chapter, chapter_num)
+                        chapters.append(chapter)
+                        chapter_num += 1
+
+            return chapters
+
+        except Exception as e:
+            logger.error(f"Error extracting chapters: {str(e)}")
+            raise
+
+    def _iter_chapters(self, book: epub.EpubBook):
+        """Yield chapters from EPUB book in correct order, one at a time."""
         try:
             # Get the spine (reading order)
-            spine_items = [item[0] for item in book.spine if item[1] == 'yes']
-            
+            spine_items = [item_id for item_id, linear in book.spine
+                           if linear == 'yes']
+            items_by_id = {it.get_id(): it for it in book.get_items()}
+
             chapter_num = 1
             for item_id in spine_items:
-                item = book.get_item_with_id(item_id)
-                
-                if item and hasattr(item, 'get_content'):
-                    content = item.get_content()
-                    
-                    if content:
-                        # Parse HTML content
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # Extract title
-                        title = self._extract_chapter_title(soup, chapter_num)
-                        
-                        # Extract text content
-                        text_content = self._extract_text_content(soup)
-                        
-                        if text_content.strip():  # Only add chapters with content
-                            chapters.append({
-                                'title': title,
-                                'content': text_content,
-                                'chapter_num': chapter_num,
-                                'item_id': item_id,
-                                'word_count': len(text_content.split())
-                            })
-                            chapter_num += 1
-            
+                chapter = self._parse_spine_item(items_by_id.get(item_id), item_id)
+                if chapter:
+                    self._number_chapter(chapter, chapter_num)
+                    yield chapter
+                    chapter_num += 1
+
         except Exception as e:
             logger.error(f"Error extracting chapters: {str(e)}")
             raise
-        
-        return chapters
+
+    def _parse_spine_item(self, item, item_id: str) -> Optional[Dict[str, Any]]:
+        """Parse one spine item into a chapter dict.
+
+        Returns None for items without usable text. The returned dict has
+        no chapter number yet and an empty title when the HTML carried
+        none; _number_chapter fills both once the kept chapters are known.
+        """
+        if not (item and hasattr(item, 'get_content')):
+            return None
+
+        content = item.get_content()
+        if not content:
+            return None
+
+        parsed = None
+        if LXML_AVAILABLE:
+            try:
+                parsed = self._parse_html_lxml(content)
+            except etree.ParserError:
+                parsed = None  # malformed markup; let soup have a go
+
+        if parsed is None:
+            soup = BeautifulSoup(content, 'html.parser')
+            parsed = (self._extract_chapter_title(soup),
+                      self._extract_text_content(soup))
+
+        title, text_content = parsed
+        if not text_content.strip():
+            return None
+
+        return {
+            'title': title,
+            'content': text_content,
+            'item_id': item_id,
+            'word_count': len(text_content.split())
+        }
+
+    def _parse_html_lxml(self, content: bytes) -> tuple:
+        """Extract (title, text) from chapter HTML with lxml.
+
+        strip_elements removes script/style in one C-level pass and
+        text_content() gathers the text without a Python-mediated walk,
+        so the whole extraction is native-code traversals. Title rules
+        match the soup path: first non-empty heading in document order,
+        <title> as fallback, '' when neither exists.
+        """
+        tree = lxml_html.fromstring(content)
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+
+        title = ''
+        title_fallback = ''
+        for element in tree.iter('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'title'):
+            text = element.text_content().strip()
+            if element.tag == 'title':
+                if not title_fallback:
+                    title_fallback = text
+            elif text:
+                title = text
+                break
+
+        return (title or title_fallback,
+                _WS_RE.sub(' ', tree.text_content()).strip())
+
+    @staticmethod
+    def _number_chapter(chapter: Dict[str, Any], chapter_num: int):
+        """Assign the ordinal and the fallback title to a kept chapter."""
+        chapter['chapter_num'] = chapter_num
+        if not chapter['title']:
+            chapter['title'] = f"Chapter {chapter_num}"
+
+    def iter_chapters(self, epub_path: str):
+        """
+        Stream chapters from an EPUB file one at a time.
+
+        Unlike parse_epub, this never materializes the full chapter list,
+        so peak memory stays bounded by a single chapter.
+
+        Args:
+            epub_path (str): Path to the EPUB file
+
+        Yields:
+            Dict containing one chapter's title, content, and word count
+        """
+        if not self._validate_epub_file(epub_path):
+            raise ValueError(f"Invalid EPUB file: {epub_path}")
+
+        book = epub.read_epub(epub_path)
+        yield from self._iter_chapters(book)
     
-    def _extract_chapter_title(self, soup: BeautifulSoup, chapter_num: int) -> str:
-        """Extract chapter title from HTML content."""
-        # Try different heading tags
-        for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            heading = soup.find(tag)
-            if heading and heading.get_text().strip():
-                return heading.get_text().strip()
-        
-        # Try title tag
-        title_tag = soup.find('title')
-        if title_tag and title_tag.get_text().strip():
-            return title_tag.get_text().strip()
-        
-        # Fallback to generic chapter name
-        return f"Chapter {chapter_num}"
+    def _extract_chapter_title(self, soup: BeautifulSoup) -> str:
+        """Extract chapter title from HTML content, '' when none found.
+
+        One walk over the tree instead of a full soup.find scan per
+        heading level: the first non-empty heading in document order
+        wins, with the <title> tag remembered as the fallback.
+        """
+        title_text = ''
+        for element in soup.descendants:
+            name = element.name
+            if name in _HEADING_TAGS:
+                text = element.get_text().strip()
+                if text:
+                    return text
+            elif name == 'title' and not title_text:
+                title_text = element.get_text().strip()
+
+        return title_text
     
     def _extract_text_content(self, soup: BeautifulSoup) -> str:
         """Extract clean text content from HTML."""
@@ -176,16 +316,29 @@ class EPUBParser:
         for script in soup(["script", "style"]):
             script.decompose()
         
-        # Get text content
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text
+        # Get text content and collapse whitespace in one regex pass;
+        # the old splitlines/split("  ") pipeline looped over every line
+        # and phrase in the interpreter
+        return _WS_RE.sub(' ', soup.get_text()).strip()
     
+    def get_cover_image(self, epub_path: str) -> Optional[bytes]:
+        """
+        Extract just the cover image from an EPUB file.
+
+        parse_epub no longer loads the cover; call this when the bytes
+        are actually needed.
+
+        Args:
+            epub_path (str): Path to the EPUB file
+
+        Returns:
+            Optional[bytes]: Cover image data, or None if there is none
+        """
+        if not self._validate_epub_file(epub_path):
+            raise ValueError(f"Invalid EPUB file: {epub_path}")
+
+        return self._extract_cover_image(epub.read_epub(epub_path))
+
     def _extract_cover_image(self, book: epub.EpubBook) -> Optional[bytes]:
         """Extract cover image from EPUB if available."""
         try:
@@ -205,23 +358,40 @@ class EPUBParser:
             return None
     
     def get_book_info(self, epub_path: str) -> Dict[str, Any]:
-        """Get basic information about an EPUB file without full parsing."""
+        """Get basic information about an EPUB file without full parsing.
+
+        Reads container.xml and the OPF package document straight from
+        the zip instead of going through epub.read_epub, which loads and
+        parses every HTML item just to be thrown away here. Metadata and
+        spine count come from two small XML files, no HTML parsing at all.
+        """
         try:
-            book = epub.read_epub(epub_path)
-            metadata = self._extract_metadata(book)
-            
-            # Count chapters quickly
-            spine_items = [item[0] for item in book.spine if item[1] == 'yes']
-            chapter_count = len(spine_items)
-            
+            with zipfile.ZipFile(epub_path) as zip_file:
+                container = ET.fromstring(zip_file.read('META-INF/container.xml'))
+                rootfile = container.find(
+                    './/{urn:oasis:names:tc:opendocument:xmlns:container}rootfile')
+                opf = ET.fromstring(zip_file.read(rootfile.get('full-path')))
+
+            def dc_field(field: str, default: str) -> str:
+                element = opf.find('.//{http://purl.org/dc/elements/1.1/}' + field)
+                if element is not None and element.text:
+                    return element.text.strip()
+                return default
+
             return {
-                'title': metadata.get('title', 'Unknown'),
-                'author': metadata.get('author', 'Unknown'),
-                'language': metadata.get('language', 'en'),
-                'chapter_count': chapter_count,
+                'title': dc_field('title', 'Unknown'),
+                'author': dc_field('creator', 'Unknown'),
+                'language': dc_field('language', 'en'),
+                'description': dc_field('description', ''),
+                # Non-linear itemrefs (covers, notes) are skipped, matching
+                # the linear == 'yes' filter the chapter extraction applies;
+                # the attribute defaults to yes when absent
+                'chapter_count': sum(
+                    1 for ref in opf.findall('.//{*}spine/{*}itemref')
+                    if ref.get('linear') != 'no'),
                 'file_size': os.path.getsize(epub_path)
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting book info: {str(e)}")
             return {}
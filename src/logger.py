@@ -5,6 +5,7 @@ Provides comprehensive logging functionality for the EPUB to Audiobook converter
 """
 
 import os
+import time
 import logging
 import logging.handlers
 from pathlib import Path
@@ -12,7 +13,42 @@ from typing import Optional
 import sys
 from datetime import datetime
 
-def setup_logger(name: str, log_level: str = "INFO", 
+# Log directories already created this run; setup_logger can be called
+# repeatedly against the same path and makedirs walks the whole chain
+# each time
+_created_dirs = set()
+
+# Formatters are stateless for a fixed format string, so every
+# setup_logger call shares these instead of constructing its own
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+_DEFAULT_FORMATTER = logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATEFMT)
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler with a cheap rollover check.
+
+    The stock shouldRollover stats the log file (exists + isfile) on
+    every record before looking at the size. Records that leave the file
+    comfortably under maxBytes - virtually all of them - now short-
+    circuit on stream.tell() alone; the full stat-based check only runs
+    when the size is actually near the limit.
+    """
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+
+        if self.stream is None:
+            self.stream = self._open()
+
+        msg = "%s\n" % self.format(record)
+        if self.stream.tell() + len(msg) < self.maxBytes:
+            return False
+
+        return super().shouldRollover(record)
+
+def setup_logger(name: str, log_level: str = "INFO",
                 log_file: Optional[str] = None, 
                 console_output: bool = True) -> logging.Logger:
     """
@@ -35,12 +71,10 @@ def setup_logger(name: str, log_level: str = "INFO",
     # Clear existing handlers to avoid duplicates
     logger.handlers.clear()
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
+    # Shared formatter; handlers don't mutate it
+    formatter = _DEFAULT_FORMATTER
+
+
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
@@ -51,13 +85,14 @@ def setup_logger(name: str, log_level: str = "INFO",
     # File handler
     if log_file:
         try:
-            # Create log directory if it doesn't exist
+            # Create log directory if it doesn't exist (once per path)
             log_dir = os.path.dirname(log_file)
-            if log_dir:
+            if log_dir and log_dir not in _created_dirs:
                 os.makedirs(log_dir, exist_ok=True)
+                _created_dirs.add(log_dir)
             
             # Create rotating file handler (max 10MB, keep 5 backups)
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = FastRotatingFileHandler(
                 log_file, 
                 maxBytes=10*1024*1024,  # 10MB
                 backupCount=5,
@@ -65,8 +100,20 @@ def setup_logger(name: str, log_level: str = "INFO",
             )
             file_handler.setLevel(logging.DEBUG)  # File gets all messages
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-            
+
+            # Coalesce file writes: records buffer in memory and hit the
+            # disk in batches of 512 (or immediately on ERROR), so a
+            # log-heavy conversion pays one write/rollover check per
+            # batch instead of per record. logging.shutdown closes the
+            # buffer at exit, which flushes whatever is left.
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=512,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
+            logger.addHandler(buffered_handler)
+
         except Exception as e:
             # If file logging fails, just log to console
             logger.warning(f"Could not set up file logging: {str(e)}")
@@ -105,13 +152,13 @@ def setup_application_logging(config: dict) -> logging.Logger:
         'epub_to_audiobook.config_manager'
     ]
     
+    # Component records reach the file through propagation to the main
+    # logger - attaching a handler per component would mean five
+    # RotatingFileHandler instances contending on the same file, each
+    # with its own fd and rollover checks
+    level = getattr(logging, log_level.upper(), logging.INFO)
     for logger_name in component_loggers:
-        component_logger = setup_logger(
-            logger_name,
-            log_level=log_level,
-            log_file=log_file,
-            console_output=False  # Only main logger outputs to console
-        )
+        logging.getLogger(logger_name).setLevel(level)
     
     # Log application startup
     main_logger.info("="*60)
@@ -134,18 +181,20 @@ class ProgressLogger:
         self.total_items = total_items
         self.operation_name = operation_name
         self.current_item = 0
-        self.start_time = datetime.now()
-        
+        # monotonic: cheaper than datetime.now() per tick and immune to
+        # wall-clock jumps that would corrupt the ETA
+        self.start_time = time.monotonic()
+
     def update(self, increment: int = 1, item_name: str = None):
         """Update progress and log if needed."""
         self.current_item += increment
-        
+
         # Log every 10% or at specific milestones
-        if (self.current_item % max(1, self.total_items // 10) == 0 or 
+        if (self.current_item % max(1, self.total_items // 10) == 0 or
             self.current_item == self.total_items):
-            
+
             progress_percent = (self.current_item / self.total_items) * 100
-            elapsed_time = (datetime.now() - self.start_time).total_seconds()
+            elapsed_time = time.monotonic() - self.start_time
             
             if self.current_item < self.total_items and elapsed_time > 0:
                 estimated_total = elapsed_time * self.total_items / self.current_item
@@ -164,7 +213,7 @@ class ProgressLogger:
     
     def finish(self):
         """Log completion of the operation."""
-        elapsed_time = (datetime.now() - self.start_time).total_seconds()
+        elapsed_time = time.monotonic() - self.start_time
         self.logger.info(
             f"{self.operation_name} completed in {elapsed_time:.1f} seconds"
         )
@@ -177,16 +226,24 @@ class PerformanceLogger:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.start_times = {}
-        
+        # One process handle for the logger's lifetime; constructing
+        # psutil.Process opens /proc entries, too heavy to redo per call
+        try:
+            import psutil
+            self._process = psutil.Process()
+        except ImportError:
+            self._process = None
+
+
     def start_timer(self, operation: str):
         """Start timing an operation."""
-        self.start_times[operation] = datetime.now()
-        self.logger.debug(f"Started: {operation}")
+        self.start_times[operation] = time.monotonic()
+        self.logger.debug("Started: %s", operation)
         
     def end_timer(self, operation: str, log_level: str = "INFO"):
         """End timing an operation and log the duration."""
         if operation in self.start_times:
-            duration = (datetime.now() - self.start_times[operation]).total_seconds()
+            duration = time.monotonic() - self.start_times[operation]
             
             level = getattr(logging, log_level.upper(), logging.INFO)
             self.logger.log(level, f"Completed: {operation} in {duration:.2f} seconds")
@@ -199,15 +256,15 @@ class PerformanceLogger:
     
     def log_memory_usage(self):
         """Log current memory usage if psutil is available."""
+        # Skip the process poll entirely unless DEBUG records will be kept
+        if self._process is None or not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         try:
-            import psutil
-            process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            self.logger.debug(f"Memory usage: {memory_mb:.1f} MB")
-        except ImportError:
-            pass  # psutil not available
+            memory_mb = self._process.memory_info().rss / 1024 / 1024
+            self.logger.debug("Memory usage: %.1f MB", memory_mb)
         except Exception as e:
-            self.logger.debug(f"Could not get memory usage: {str(e)}")
+            self.logger.debug("Could not get memory usage: %s", e)
 
 def log_system_info(logger: logging.Logger):
     """Log system information for debugging purposes."""
@@ -272,13 +329,32 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m', # Magenta
         'RESET': '\033[0m'      # Reset
     }
-    
+
+    # Pre-colored level names, built once at class creation so no ANSI
+    # string is assembled per record
+    _COLORED_LEVELS = {
+        'DEBUG': f"{COLORS['DEBUG']}DEBUG{COLORS['RESET']}",
+        'INFO': f"{COLORS['INFO']}INFO{COLORS['RESET']}",
+        'WARNING': f"{COLORS['WARNING']}WARNING{COLORS['RESET']}",
+        'ERROR': f"{COLORS['ERROR']}ERROR{COLORS['RESET']}",
+        'CRITICAL': f"{COLORS['CRITICAL']}CRITICAL{COLORS['RESET']}",
+    }
+
     def format(self, record):
-        # Add color to level name
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{color}{record.levelname}{self.COLORS['RESET']}"
-        
-        return super().format(record)
+        # Swap in the cached colored level name, restoring the original
+        # afterwards - records are shared between handlers, so leaving
+        # ANSI codes on record.levelname would bleed color into the
+        # file handler's output
+        original_levelname = record.levelname
+        record.levelname = self._COLORED_LEVELS.get(
+            original_levelname, original_levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original_levelname
+
+# Shared colored counterpart of _DEFAULT_FORMATTER
+_COLORED_FORMATTER = ColoredFormatter(_LOG_FORMAT, datefmt=_LOG_DATEFMT)
 
 def setup_colored_console_logging(logger: logging.Logger):
     """Set up colored console logging if supported."""
@@ -288,11 +364,7 @@ def setup_colored_console_logging(logger: logging.Logger):
             # Find console handler and replace formatter
             for handler in logger.handlers:
                 if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                    colored_formatter = ColoredFormatter(
-                        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                        datefmt='%Y-%m-%d %H:%M:%S'
-                    )
-                    handler.setFormatter(colored_formatter)
+                    handler.setFormatter(_COLORED_FORMATTER)
                     break
     except Exception:
         pass  # Fall back to standard formatting
@@ -0,0 +1,158 @@
+"""
+Conversion Pipeline Module
+
+Shared EPUB-to-audiobook conversion flow used by the CLI entry points.
+"""
+
+import os
+import sys
+import queue
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import click
+from colorama import Fore, Style
+
+logger = logging.getLogger(__name__)
+
+def _prefetched(iterable, depth: int = 2):
+    """Iterate with a background thread keeping the next items ready.
+
+    Classic double-buffering: the producer (chapter synthesis) runs one
+    step ahead of the consumer (the encoder), so encoding chapter N
+    overlaps with synthesizing chapter N+1 instead of alternating. The
+    bounded queue caps how many chapter waveforms sit in memory.
+    """
+    items = queue.Queue(maxsize=depth)
+
+    def _producer():
+        try:
+            for item in iterable:
+                items.put(('item', item))
+        except Exception as e:
+            items.put(('error', e))
+        else:
+            items.put(('done', None))
+
+    worker = threading.Thread(target=_producer, daemon=True)
+    worker.start()
+
+    while True:
+        kind, value = items.get()
+        if kind == 'item':
+            yield value
+        elif kind == 'error':
+            raise value
+        else:
+            break
+
+def run_conversion(config: Dict[str, Any], input_path: str,
+                   output_dir: str) -> Optional[tuple]:
+    """
+    Run the full conversion of one EPUB file with the given settings.
+
+    Owns the parser/text/TTS/audio components and the chapter flow, so
+    both entry points share a single hot path instead of maintaining
+    two diverging copies of it.
+
+    Args:
+        config (Dict): Fully resolved configuration
+        input_path (str): Path to the input EPUB file
+        output_dir (str): Output directory for the audiobook
+
+    Returns:
+        tuple: (path to the final audiobook file, size in bytes) or
+        None if failed
+    """
+    # Imported here so loading this module stays cheap; the heavy
+    # dependencies only come in once a conversion actually starts
+    from src.epub_parser import EPUBParser
+    from src.text_processor import TextProcessor
+    from src.tts_engine import TTSEngine
+    from src.audio_processor import AudioProcessor
+
+    # Create output directory
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    # Initialize components
+    epub_parser = EPUBParser()
+    text_processor = TextProcessor(
+        cache_dir=os.path.join(config.get('temp_dir', './temp'), 'clean_cache'))
+    tts_engine = TTSEngine(config)
+    audio_processor = AudioProcessor(config)
+
+    # Parse EPUB file
+    logger.info("Parsing EPUB file...")
+    book_data = epub_parser.parse_epub(input_path)
+
+    if not book_data['chapters']:
+        logger.error("No chapters found in EPUB file")
+        return None
+
+    click.echo(f"{Fore.GREEN}✓{Style.RESET_ALL} Found {len(book_data['chapters'])} chapters")
+
+    # Clean all chapter texts up front, then hand the whole batch to
+    # the TTS engine so the synthesis stage owns its own scheduling
+    processed_texts = text_processor.clean_texts_batch(
+        [chapter['content'] for chapter in book_data['chapters']])
+
+    cleaned_entries = []
+    for i, (chapter, processed_text) in enumerate(zip(book_data['chapters'], processed_texts)):
+        if not processed_text.strip():
+            logger.warning(f"Chapter {i+1} has no content, skipping...")
+            continue
+
+        cleaned_entries.append((i + 1, chapter['title'], processed_text))
+
+    # Repaint the bar at most ~100 times per book (each update is an
+    # ANSI redraw plus a write syscall), and send it to the bit bucket
+    # when stderr isn't a terminal so logs and CI output stay clean
+    progress_file = sys.stderr if sys.stderr.isatty() else open(os.devnull, 'w')
+    bar_settings = {
+        'length': len(cleaned_entries),
+        'label': 'Converting chapters',
+        'update_min_steps': max(1, len(cleaned_entries) // 100),
+        'file': progress_file,
+    }
+
+    try:
+        if config.get('stream_output'):
+            # Pipe PCM straight into the final container: no per-chapter
+            # WAV files and no read-back pass during the merge
+            with click.progressbar(**bar_settings) as bar:
+                result = audio_processor.stream_audiobook(
+                    _prefetched(tts_engine.iter_chapter_waveforms(
+                        cleaned_entries,
+                        progress_callback=lambda _chapter_num: bar.update(1))),
+                    book_data,
+                    output_dir,
+                    tts_engine.output_sample_rate
+                )
+        else:
+            with click.progressbar(**bar_settings) as bar:
+                audio_files = tts_engine.text_to_speech_batch(
+                    cleaned_entries,
+                    output_dir,
+                    progress_callback=lambda _chapter_num: bar.update(1)
+                )
+
+            if not audio_files:
+                logger.error("No audio files were generated")
+                return None
+
+            click.echo(f"\n{Fore.GREEN}✓{Style.RESET_ALL} Generated {len(audio_files)} audio files")
+
+            # Merge audio files into final audiobook
+            logger.info("Merging audio files into audiobook...")
+            result = audio_processor.merge_audiobook(
+                audio_files,
+                book_data,
+                output_dir
+            )
+    finally:
+        if progress_file is not sys.stderr:
+            progress_file.close()
+
+    return result
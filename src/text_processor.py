@@ -4,97 +4,200 @@ Text Processor Module
 Handles text cleaning, processing, and preparation for TTS conversion.
 """
 
+import os
 import re
+import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 from typing import List, Dict, Optional
 import unicodedata
 
+from ._safe_filename import sanitize
+
 logger = logging.getLogger(__name__)
 
+# Smart quotes, dashes, and typographic punctuation mapped to plain
+# ASCII. Every source is a single code point, so one str.translate call
+# replaces them all in a single C-level pass instead of ~20 full
+# text.replace scans.
+_UNICODE_TRANSLATE = str.maketrans({
+    '“': '"',    # left double quotation mark
+    '”': '"',    # right double quotation mark
+    '‘': "'",    # left single quotation mark
+    '’': "'",    # right single quotation mark
+    '–': '-',    # en dash
+    '—': ' - ',  # em dash
+    '…': '...',  # horizontal ellipsis
+    '«': '"',    # left guillemet
+    '»': '"',    # right guillemet
+    '‹': "'",    # single left guillemet
+    '›': "'",    # single right guillemet
+    '‚': ',',    # low single quote
+    '„': '"',    # low double quote
+    '‟': '"',    # high reversed double quote
+    '′': "'",    # prime
+    '″': '"',    # double prime
+    '‴': '"""',  # triple prime
+    '‼': '!!',   # double exclamation
+    '⁇': '??',   # double question
+    '⁈': '?!',   # question exclamation
+    '⁉': '!?',   # exclamation question
+})
+
+# Counting patterns: finditer counts matches without materializing a
+# list of all the word/paragraph strings the way str.split does
+_WORD_RE = re.compile(r'\S+')
+_PARAGRAPH_RE = re.compile(r'[^\n]+(?:\n[^\n]+)*')
+
+# Common abbreviations and their expansions, frozen so every
+# TextProcessor shares one table instead of rebuilding the literal
+_ABBREVIATIONS = MappingProxyType({
+    'Dr.': 'Doctor',
+    'Mr.': 'Mister',
+    'Mrs.': 'Missus',
+    'Ms.': 'Miss',
+    'Prof.': 'Professor',
+    'St.': 'Saint',
+    'Ltd.': 'Limited',
+    'Inc.': 'Incorporated',
+    'Corp.': 'Corporation',
+    'Co.': 'Company',
+    'etc.': 'etcetera',
+    'vs.': 'versus',
+    'e.g.': 'for example',
+    'i.e.': 'that is',
+    'cf.': 'compare',
+    'et al.': 'and others',
+    'Ph.D.': 'Doctor of Philosophy',
+    'M.D.': 'Doctor of Medicine',
+    'B.A.': 'Bachelor of Arts',
+    'M.A.': 'Master of Arts',
+    'B.S.': 'Bachelor of Science',
+    'M.S.': 'Master of Science',
+    'U.S.': 'United States',
+    'U.K.': 'United Kingdom',
+    'U.N.': 'United Nations',
+    'USA': 'United States of America',
+    'UK': 'United Kingdom',
+    'EU': 'European Union',
+    'NATO': 'North Atlantic Treaty Organization',
+    'CEO': 'Chief Executive Officer',
+    'CFO': 'Chief Financial Officer',
+    'CTO': 'Chief Technology Officer',
+    'HR': 'Human Resources',
+    'IT': 'Information Technology',
+    'AI': 'Artificial Intelligence',
+    'API': 'Application Programming Interface',
+    'URL': 'Uniform Resource Locator',
+    'HTTP': 'Hypertext Transfer Protocol',
+    'HTML': 'Hypertext Markup Language',
+    'CSS': 'Cascading Style Sheets',
+    'JS': 'JavaScript',
+    'SQL': 'Structured Query Language',
+    'XML': 'Extensible Markup Language',
+    'JSON': 'JavaScript Object Notation',
+    'PDF': 'Portable Document Format',
+    'GPS': 'Global Positioning System',
+    'DVD': 'Digital Versatile Disc',
+    'CD': 'Compact Disc',
+    'TV': 'Television',
+    'PC': 'Personal Computer',
+    'FAQ': 'Frequently Asked Questions',
+    'ATM': 'Automated Teller Machine',
+    'WiFi': 'Wireless Fidelity',
+    'USB': 'Universal Serial Bus',
+    'RAM': 'Random Access Memory',
+    'CPU': 'Central Processing Unit',
+    'GPU': 'Graphics Processing Unit',
+    'SSD': 'Solid State Drive',
+    'HDD': 'Hard Disk Drive'
+})
+
+# Alternation over all abbreviations, longest first so 'Ph.D.' wins
+# over 'D.'-style prefixes. The terminator is a (?!\w) lookahead rather
+# than \b because there is no word boundary between a trailing '.' and
+# the space after it - with \b the dotted entries never matched at all.
+_ABBREV_ALTERNATION = '|'.join(
+    re.escape(k) for k in sorted(_ABBREVIATIONS, key=len, reverse=True))
+_ABBREV_MAP = {k.lower(): v for k, v in _ABBREVIATIONS.items()}
+
+# Master scrub pattern: URL/email/HTML removal, excess-punctuation
+# collapsing, and abbreviation expansion fused into one alternation.
+# The string cleaning is memory-bound - the work per character is
+# trivial next to the cost of re-reading and re-allocating the whole
+# chapter - so one scan dispatching per matched branch replaces seven
+# full passes. Branch order matters: URLs and emails come first so an
+# abbreviation inside an address can't be expanded.
+_MASTER_RE = re.compile(
+    r'(?P<url>http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)'
+    r'|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<html><[^>]+>)'
+    r'|(?P<excl>!{3,})'
+    r'|(?P<quest>\?{3,})'
+    r'|(?P<dots>\.{4,})'
+    r'|(?P<abbrev>\b(?:' + _ABBREV_ALTERNATION + r')(?!\w))',
+    re.IGNORECASE)
+
+# Fixed replacements per branch; abbreviations resolve through the map
+_MASTER_REPLACEMENTS = {
+    'url': '', 'email': '', 'html': '',
+    'excl': '!', 'quest': '?', 'dots': '...'
+}
+
+def _master_replace(match: re.Match) -> str:
+    """Dispatch a master-pattern match to its replacement."""
+    kind = match.lastgroup
+    if kind == 'abbrev':
+        return _ABBREV_MAP[match.group().lower()]
+    return _MASTER_REPLACEMENTS[kind]
+
+# Per-process TextProcessor used by clean_texts_batch workers
+_batch_processor = None
+
+def _clean_one(text: str) -> str:
+    """Clean a single text in a worker process."""
+    global _batch_processor
+    if _batch_processor is None:
+        _batch_processor = TextProcessor()
+    return _batch_processor.clean_text(text)
+
 class TextProcessor:
     """
     Processes and cleans text content for optimal TTS conversion.
     """
-    
-    def __init__(self):
-        # Common abbreviations and their expansions
-        self.abbreviations = {
-            'Dr.': 'Doctor',
-            'Mr.': 'Mister',
-            'Mrs.': 'Missus',
-            'Ms.': 'Miss',
-            'Prof.': 'Professor',
-            'St.': 'Saint',
-            'Ltd.': 'Limited',
-            'Inc.': 'Incorporated',
-            'Corp.': 'Corporation',
-            'Co.': 'Company',
-            'etc.': 'etcetera',
-            'vs.': 'versus',
-            'e.g.': 'for example',
-            'i.e.': 'that is',
-            'cf.': 'compare',
-            'et al.': 'and others',
-            'Ph.D.': 'Doctor of Philosophy',
-            'M.D.': 'Doctor of Medicine',
-            'B.A.': 'Bachelor of Arts',
-            'M.A.': 'Master of Arts',
-            'B.S.': 'Bachelor of Science',
-            'M.S.': 'Master of Science',
-            'U.S.': 'United States',
-            'U.K.': 'United Kingdom',
-            'U.N.': 'United Nations',
-            'USA': 'United States of America',
-            'UK': 'United Kingdom',
-            'EU': 'European Union',
-            'NATO': 'North Atlantic Treaty Organization',
-            'CEO': 'Chief Executive Officer',
-            'CFO': 'Chief Financial Officer',
-            'CTO': 'Chief Technology Officer',
-            'HR': 'Human Resources',
-            'IT': 'Information Technology',
-            'AI': 'Artificial Intelligence',
-            'API': 'Application Programming Interface',
-            'URL': 'Uniform Resource Locator',
-            'HTTP': 'Hypertext Transfer Protocol',
-            'HTML': 'Hypertext Markup Language',
-            'CSS': 'Cascading Style Sheets',
-            'JS': 'JavaScript',
-            'SQL': 'Structured Query Language',
-            'XML': 'Extensible Markup Language',
-            'JSON': 'JavaScript Object Notation',
-            'PDF': 'Portable Document Format',
-            'GPS': 'Global Positioning System',
-            'DVD': 'Digital Versatile Disc',
-            'CD': 'Compact Disc',
-            'TV': 'Television',
-            'PC': 'Personal Computer',
-            'FAQ': 'Frequently Asked Questions',
-            'ATM': 'Automated Teller Machine',
-            'GPS': 'Global Positioning System',
-            'WiFi': 'Wireless Fidelity',
-            'USB': 'Universal Serial Bus',
-            'RAM': 'Random Access Memory',
-            'CPU': 'Central Processing Unit',
-            'GPU': 'Graphics Processing Unit',
-            'SSD': 'Solid State Drive',
-            'HDD': 'Hard Disk Drive'
-        }
-        
-        # Patterns for text cleaning
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        self.phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
-        self.number_pattern = re.compile(r'\b\d+\b')
-        
+
+    # Bump when the cleaning pipeline changes so stale cache entries are ignored
+    _CACHE_VERSION = 2
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        # Optional on-disk cache of cleaned text keyed by content hash,
+        # so re-running a book with different voice/speed settings skips
+        # the whole regex pipeline for unchanged chapters
+        self.cache_dir = cache_dir
+        # Shared read-only tables, built once at import; constructing a
+        # processor (one per worker process in batch mode) no longer
+        # rebuilds the dict or recompiles the patterns
+        self.abbreviations = _ABBREVIATIONS
+
         # Sentence ending patterns
         self.sentence_endings = re.compile(r'[.!?]+')
-        
+
         # Multiple whitespace pattern
         self.whitespace_pattern = re.compile(r'\s+')
-        
+
         # Dialogue patterns
         self.dialogue_pattern = re.compile(r'"([^"]*)"')
+
+        # The rest of the pipeline's patterns, compiled once like the
+        # ones above instead of going through re.sub's cache per call
+        self._single_digit_re = re.compile(r'\b[0-9]\b')
+        self._space_before_punct_re = re.compile(r'\s+([.!?,:;])')
+        self._sentence_gap_re = re.compile(r'([.!?])\s*([A-Z])')
+        self._sentence_split_re = re.compile(r'(?<=[.!?])\s+')
+        # Capturing variant of sentence_endings so split keeps the
+        # terminators as their own tokens
+        self._sentence_tok_re = re.compile(r'([.!?]+)')
         
     def clean_text(self, text: str) -> str:
         """
@@ -106,19 +209,25 @@ class TextProcessor:
         Returns:
             str: Cleaned and processed text
         """
-        if not text or not isinstance(text, str):
+        # isspace also catches whitespace-only scaffolding pages (nav,
+        # copyright) without the stripped-copy allocation, so they skip
+        # the whole pipeline
+        if not text or not isinstance(text, str) or text.isspace():
             return ""
-        
+
+        source = text
+        cached = self._cache_get(source)
+        if cached is not None:
+            return cached
+
         try:
             # Remove or replace problematic characters
             text = self._normalize_unicode(text)
-            
-            # Remove unwanted content
-            text = self._remove_unwanted_content(text)
-            
-            # Expand abbreviations
-            text = self._expand_abbreviations(text)
-            
+
+            # Strip URLs/emails/HTML, collapse excess punctuation, and
+            # expand abbreviations - all in one scan
+            text = self._scrub_text(text)
+
             # Clean numbers and special characters
             text = self._process_numbers(text)
             
@@ -131,80 +240,103 @@ class TextProcessor:
             # Ensure proper sentence structure
             text = self._fix_sentence_structure(text)
             
-            logger.debug(f"Cleaned text: {len(text)} characters")
+            # Guarded: this runs per chunk and len() plus formatting is
+            # wasted work at the normal INFO level
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cleaned text: %d characters", len(text))
+            self._cache_put(source, text)
             return text
             
         except Exception as e:
             logger.error(f"Error cleaning text: {str(e)}")
             return text  # Return original text if cleaning fails
     
+    def clean_texts_batch(self, texts: List[str]) -> List[str]:
+        """
+        Clean a batch of texts, preserving order.
+
+        The regex pipeline is CPU-bound and texts are independent, so
+        larger batches are spread across worker processes; small batches
+        stay in-process to avoid pool startup cost.
+
+        Args:
+            texts (List[str]): Raw text contents
+
+        Returns:
+            List[str]: Cleaned texts, one per input
+        """
+        # Satisfy what we can from the disk cache; only misses hit the pipeline
+        if self.cache_dir:
+            results = [self._cache_get(text) for text in texts]
+        else:
+            results = [None] * len(texts)
+
+        pending = [i for i, cleaned in enumerate(results) if cleaned is None]
+
+        if not pending:
+            return results
+
+        if len(pending) < 4:
+            for i in pending:
+                results[i] = self.clean_text(texts[i])
+        else:
+            with ProcessPoolExecutor() as executor:
+                cleaned_iter = executor.map(
+                    _clean_one, [texts[i] for i in pending], chunksize=4)
+                for i, cleaned in zip(pending, cleaned_iter):
+                    results[i] = cleaned
+                    self._cache_put(texts[i], cleaned)
+
+        return results
+
+    def _cache_key(self, text: str) -> str:
+        """Build the cache filename stem for a piece of source text."""
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"v{self._CACHE_VERSION}-{digest}"
+
+    def _cache_get(self, text: str) -> Optional[str]:
+        """Look up previously cleaned text by content hash."""
+        if not self.cache_dir:
+            return None
+
+        try:
+            cache_path = os.path.join(self.cache_dir, self._cache_key(text) + '.txt')
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+        except Exception as e:
+            logger.debug("Could not read clean-text cache entry: %s", e)
+
+        return None
+
+    def _cache_put(self, text: str, cleaned: str):
+        """Store cleaned text under its source content hash."""
+        if not self.cache_dir:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = os.path.join(self.cache_dir, self._cache_key(text) + '.txt')
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(cleaned)
+        except Exception as e:
+            logger.debug("Could not write clean-text cache entry: %s", e)
+
     def _normalize_unicode(self, text: str) -> str:
         """Normalize unicode characters."""
-        # Normalize unicode
-        text = unicodedata.normalize('NFKD', text)
-        
-        # Replace smart quotes and dashes
-        replacements = {
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '–': '-',
-            '—': ' - ',
-            '…': '...',
-            '«': '"',
-            '»': '"',
-            '‹': "'",
-            '›': "'",
-            '‚': ',',
-            '„': '"',
-            '‟': '"',
-            '′': "'",
-            '″': '"',
-            '‴': '"""',
-            '‼': '!!',
-            '⁇': '??',
-            '⁈': '?!',
-            '⁉': '!?'
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text
+        # Normalize unicode, then map typographic punctuation to ASCII
+        # in one translate pass
+        return unicodedata.normalize('NFKD', text).translate(_UNICODE_TRANSLATE)
     
-    def _remove_unwanted_content(self, text: str) -> str:
-        """Remove unwanted content like URLs, emails, etc."""
-        # Remove URLs
-        text = self.url_pattern.sub('', text)
-        
-        # Remove email addresses
-        text = self.email_pattern.sub('', text)
-        
-        # Remove phone numbers (optional - might be part of content)
-        # text = self.phone_pattern.sub('', text)
-        
-        # Remove HTML tags if any remain
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove excessive punctuation
-        text = re.sub(r'[!]{3,}', '!', text)
-        text = re.sub(r'[?]{3,}', '?', text)
-        text = re.sub(r'[.]{4,}', '...', text)
-        
-        return text
-    
-    def _expand_abbreviations(self, text: str) -> str:
-        """Expand common abbreviations."""
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_abbrevs = sorted(self.abbreviations.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for abbrev, expansion in sorted_abbrevs:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-            text = re.sub(pattern, expansion, text, flags=re.IGNORECASE)
-        
-        return text
+    def _scrub_text(self, text: str) -> str:
+        """Remove unwanted content and expand abbreviations in one pass.
+
+        URLs, email addresses, and stray HTML tags are dropped, runs of
+        excessive punctuation are collapsed, and known abbreviations are
+        expanded - one traversal of the text through the fused master
+        pattern instead of a separate substitution per concern.
+        """
+        return _MASTER_RE.sub(_master_replace, text)
     
     def _process_numbers(self, text: str) -> str:
         """Process numbers for better TTS pronunciation."""
@@ -234,8 +366,8 @@ class TextProcessor:
                 return num
         
         # Convert standalone single-digit numbers
-        text = re.sub(r'\b[0-9]\b', number_to_words, text)
-        
+        text = self._single_digit_re.sub(number_to_words, text)
+
         return text
     
     def _process_dialogue(self, text: str) -> str:
@@ -258,29 +390,29 @@ class TextProcessor:
         text = text.strip()
         
         # Fix spacing around punctuation
-        text = re.sub(r'\s+([.!?,:;])', r'\1', text)
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
-        
+        text = self._space_before_punct_re.sub(r'\1', text)
+        text = self._sentence_gap_re.sub(r'\1 \2', text)
+
         return text
     
     def _fix_sentence_structure(self, text: str) -> str:
         """Fix sentence structure for better TTS flow."""
-        # Ensure sentences end with proper punctuation
-        sentences = self.sentence_endings.split(text)
-        
+        # Split keeping terminators as separate tokens, so sentences and
+        # their own punctuation alternate: each sentence is rejoined with
+        # the mark it actually ended on, and only an unterminated trailing
+        # fragment gets a period. The old split-then-append-'.' rewrite
+        # flattened every '!' and '?' into a period.
+        parts = self._sentence_tok_re.split(text)
+
         processed_sentences = []
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
+        for i in range(0, len(parts), 2):
+            sentence = parts[i].strip()
             if sentence:
-                # Add period if sentence doesn't end with punctuation
-                if not re.search(r'[.!?]$', sentence):
-                    sentence += '.'
-                processed_sentences.append(sentence)
-        
+                terminator = parts[i + 1] if i + 1 < len(parts) else '.'
+                processed_sentences.append(sentence + terminator)
+
         # Join sentences with proper spacing
-        text = ' '.join(processed_sentences)
-        
-        return text
+        return ' '.join(processed_sentences)
     
     def split_into_chunks(self, text: str, max_length: int = 500) -> List[str]:
         """
@@ -293,24 +425,34 @@ class TextProcessor:
         Returns:
             List[str]: List of text chunks
         """
+        if not text or text.isspace():
+            return []
+
         if len(text) <= max_length:
             return [text]
         
         chunks = []
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        current_chunk = ""
+        sentences = self._sentence_split_re.split(text)
+
+        # Accumulate sentences in a list and join once per chunk; the
+        # old string += rebuilt the growing chunk on every append
+        buf = []
+        buf_len = 0
         for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= max_length:
-                current_chunk += " " + sentence if current_chunk else sentence
+            # +1 for the joining space when the buffer isn't empty
+            added = len(sentence) + 1 if buf else len(sentence)
+            if buf_len + added <= max_length:
+                buf.append(sentence)
+                buf_len += added
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-        
+                if buf:
+                    chunks.append(' '.join(buf).strip())
+                buf = [sentence]
+                buf_len = len(sentence)
+
+        if buf:
+            chunks.append(' '.join(buf).strip())
+
         return chunks
     
     def estimate_reading_time(self, text: str, wpm: int = 150) -> float:
@@ -324,28 +466,36 @@ class TextProcessor:
         Returns:
             float: Estimated reading time in minutes
         """
-        word_count = len(text.split())
+        if not text:
+            return 0.0
+
+        word_count = sum(1 for _ in _WORD_RE.finditer(text))
+        return self.estimate_reading_time_from_word_count(word_count, wpm)
+
+    def estimate_reading_time_from_word_count(self, word_count: int, wpm: int = 150) -> float:
+        """
+        Estimate reading time in minutes from a word count.
+
+        Args:
+            word_count (int): Number of words
+            wpm (int): Words per minute reading speed
+
+        Returns:
+            float: Estimated reading time in minutes
+        """
         return word_count / wpm
     
     def get_text_statistics(self, text: str) -> Dict[str, int]:
         """Get basic text statistics."""
+        # Count matches instead of splitting: no list of every word,
+        # sentence fragment, and paragraph just to take its len
         return {
             'characters': len(text),
-            'words': len(text.split()),
-            'sentences': len(re.split(r'[.!?]+', text)),
-            'paragraphs': len([p for p in text.split('\n\n') if p.strip()])
+            'words': sum(1 for _ in _WORD_RE.finditer(text)),
+            'sentences': sum(1 for _ in self.sentence_endings.finditer(text)) + 1,
+            'paragraphs': sum(1 for _ in _PARAGRAPH_RE.finditer(text))
         }
     
     def _create_safe_filename(self, title: str) -> str:
         """Create a safe filename from chapter title."""
-        # Remove invalid characters
-        safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_. "
-        safe_title = ''.join(c for c in title if c in safe_chars)
-        
-        # Replace spaces with underscores and limit length
-        safe_title = safe_title.replace(' ', '_')[:50]
-        
-        # Remove leading/trailing dots and dashes
-        safe_title = safe_title.strip('.-_')
-        
-        return safe_title or "chapter"
+        return sanitize(title)
@@ -5,8 +5,10 @@ Handles text-to-speech conversion using various TTS engines with GPU acceleratio
 """
 
 import os
+import re
 import logging
-import tempfile
+import queue
+import functools
 import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -27,12 +29,11 @@ except ImportError:
     NUMPY_AVAILABLE = False
     np = None
 
-try:
-    from TTS.api import TTS
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
-    TTS = None
+# Probe availability from finder metadata only; importing TTS.api pulls
+# in the whole Coqui stack and costs seconds, so the real import is
+# deferred to the first model load
+import importlib.util
+TTS_AVAILABLE = importlib.util.find_spec("TTS") is not None
 
 try:
     import soundfile as sf
@@ -41,13 +42,59 @@ except ImportError:
     SOUNDFILE_AVAILABLE = False
     sf = None
 
+from ._safe_filename import sanitize
+
+# One sentence per match: text through its terminator run plus trailing
+# whitespace, with a final alternative so a tail without a terminator
+# still matches
+_SENTENCE_RE = re.compile(r'[^.!?]+[.!?]+\s*|[^.!?]+$')
+
 logger = logging.getLogger(__name__)
 
+# librosa is a heavy import only needed on fallback paths; resolved once
+# on first use instead of executing import machinery inside hot methods
+_librosa = None
+
+def _get_librosa():
+    """Import librosa lazily, once, and return the cached module."""
+    global _librosa
+    if _librosa is None:
+        import librosa
+        _librosa = librosa
+    return _librosa
+
+# Worker-side engine for the CPU process pool; built once per worker by
+# _init_worker and reused for every chapter scheduled onto that process
+_WORKER_ENGINE = None
+
+def _init_worker(config: Dict[str, Any]):
+    """Process-pool initializer: load one TTS engine per worker."""
+    global _WORKER_ENGINE
+    # One intra-op torch thread per worker - the pool already saturates
+    # the cores, and letting every worker spawn its own thread team
+    # would oversubscribe them
+    torch.set_num_threads(1)
+    _WORKER_ENGINE = TTSEngine(config)
+
+def _worker_text_to_speech(args) -> Optional[str]:
+    """Synthesize one chapter on the worker's engine."""
+    chapter_num, title, text, output_dir = args
+    return _WORKER_ENGINE.text_to_speech(text, title, output_dir, chapter_num)
+
 class TTSEngine:
     """
     High-quality text-to-speech engine with GPU acceleration support.
     """
-    
+
+    # Loaded TTS models shared across engine instances in this process,
+    # keyed by (model_name, device). Model loads cost seconds and hundreds
+    # of MB, so constructing another engine must not repeat them.
+    _model_cache: Dict[tuple, Any] = {}
+
+    # Chunks between torch.cuda.empty_cache() calls; empty_cache
+    # synchronizes the stream, so it must not run per chunk
+    _EMPTY_CACHE_INTERVAL = 32
+
     def __init__(self, config: Dict[str, Any]):
         # Check for required dependencies
         missing_deps = []
@@ -94,13 +141,31 @@ class TTSEngine:
         self.speaker = config.get('speaker', 'default')
         self.speed = config.get('speed', 1.0)
         self.pitch = config.get('pitch', 1.0)
+        self.precision = config.get('precision', 'fp32')
+        # Autocast dtype for GPU synthesis: bf16 keeps fp32's exponent
+        # range so it is the safer choice where the hardware supports
+        # it, but fp16-cast weights (precision='fp16') need matching
+        # fp16 autocast
+        self._autocast_dtype = torch.float16
+        if self.precision != 'fp16':
+            try:
+                if torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+                    self._autocast_dtype = torch.bfloat16
+            except Exception:
+                pass
+        self.target_sample_rate = config.get('sample_rate')
+        self._resampler = None
         self._use_alternative_engine = False
         self.alternative_engine = None
         self.voice = config.get('voice', 'en')
         self.speaker = config.get('speaker', 'default')
         self.speed = config.get('speed', 1.0)
         self.pitch = config.get('pitch', 1.0)
-        
+        # Decided once: with default speed/pitch every chunk would still
+        # pay _apply_audio_effects' call and try/except overhead
+        self._effects_needed = self.speed != 1.0 or self.pitch != 1.0
+        self._chunks_since_release = 0
+
         # Initialize TTS model
         if not self._use_alternative_engine:
             self._initialize_tts()
@@ -124,10 +189,9 @@ class TTSEngine:
             # Determine the best model based on language
             model_name = self._get_model_for_language(self.voice)
             
-            logger.info(f"Loading TTS model: {model_name}")
-            
-            # Initialize TTS with the selected model
-            self.tts_model = TTS(model_name=model_name, progress_bar=False, gpu=self.device == 'cuda')
+            # Initialize TTS with the selected model (reusing a warm one
+            # from the cache when available)
+            self.tts_model = self._load_model(model_name)
             
             # Check if model supports multiple speakers
             if hasattr(self.tts_model, 'speakers') and self.tts_model.speakers:
@@ -140,19 +204,130 @@ class TTSEngine:
                     self.speaker = self.tts_model.speakers[0]
                     logger.info(f"Using default speaker: {self.speaker}")
             
+            # Apply reduced precision if requested
+            self._apply_precision()
+
+            # Memoize the phonemizer before the model gets wrapped
+            self._install_tokenizer_cache()
+
+            # Compile for lower per-kernel overhead on GPU
+            self._compile_model()
+
             logger.info("TTS model loaded successfully")
-            
+
         except Exception as e:
             logger.error(f"Error initializing TTS model: {str(e)}")
             # Fallback to default model
             try:
                 logger.info("Falling back to default TTS model")
-                self.tts_model = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC", 
-                                   progress_bar=False, 
-                                   gpu=self.device == 'cuda')
+                self.tts_model = self._load_model("tts_models/en/ljspeech/tacotron2-DDC")
             except Exception as fallback_error:
                 logger.error(f"Failed to load fallback model: {str(fallback_error)}")
                 raise
+
+        # Hoisted once per model load: both sit on the per-chunk hot
+        # path, where the synthesizer dereference chain and the
+        # hasattr probe would otherwise run for every chunk
+        self.sample_rate = self.tts_model.synthesizer.output_sample_rate
+        self._has_speakers = bool(getattr(self.tts_model, 'speakers', None))
+
+    def _apply_precision(self):
+        """Apply the configured reduced-precision mode to the loaded model.
+
+        FP16 halves memory bandwidth and unlocks tensor cores, so it is
+        only applied on CUDA; dynamic INT8 quantization targets the CPU
+        path. Any failure leaves the model at full precision.
+        """
+        if self.precision == 'fp32':
+            return
+
+        try:
+            model = getattr(self.tts_model.synthesizer, 'tts_model', None)
+            if model is None:
+                logger.warning("Cannot access underlying model; keeping FP32")
+                return
+
+            if self.precision == 'fp16':
+                if self.device == 'cuda':
+                    model.half()
+                    logger.info("TTS model weights cast to FP16")
+            elif self.precision == 'int8':
+                import torch.nn as nn
+                self.tts_model.synthesizer.tts_model = torch.ao.quantization.quantize_dynamic(
+                    model, {nn.Linear, nn.LSTM, nn.GRU}, dtype=torch.qint8)
+                logger.info("TTS model dynamically quantized to INT8")
+
+        except Exception as e:
+            logger.warning(f"Could not apply precision '{self.precision}': {str(e)}")
+
+    def _install_tokenizer_cache(self):
+        """Memoize the tokenizer's text_to_ids on the loaded model.
+
+        Phonemization (espeak/gruut) is the slow CPU step ahead of the
+        model forward, and books repeat short strings constantly -
+        chapter headings, running heads, boilerplate. An LRU cache on
+        the bound method skips the phonemizer for repeats. Tokenizer
+        layout varies between model families, so failure to reach it
+        just leaves the uncached path.
+        """
+        try:
+            tokenizer = self.tts_model.synthesizer.tts_model.tokenizer
+            if getattr(tokenizer, '_text_to_ids_cached', False):
+                return
+            tokenizer.text_to_ids = functools.lru_cache(maxsize=4096)(
+                tokenizer.text_to_ids)
+            tokenizer._text_to_ids_cached = True
+            logger.debug("Tokenizer cache installed")
+        except Exception as e:
+            logger.debug("Could not install tokenizer cache: %s", e)
+
+    def _compile_model(self):
+        """Wrap the acoustic model and vocoder with torch.compile on GPU.
+
+        Single-utterance inference is dominated by per-op CPU scheduling
+        and kernel-launch overhead rather than compute; reduce-overhead
+        mode fuses kernels and captures CUDA graphs for repeated shapes.
+        Only applied on CUDA - on CPU the eager path is not launch-bound
+        and compilation time would never be recouped. Any failure leaves
+        the eager model in place.
+        """
+        if self.device != 'cuda' or not hasattr(torch, 'compile'):
+            return
+
+        try:
+            synthesizer = self.tts_model.synthesizer
+            # The model object is shared through _model_cache; don't
+            # re-wrap an already-compiled synthesizer on reuse
+            if getattr(synthesizer, '_compiled', False):
+                return
+
+            for attr in ('tts_model', 'vocoder_model'):
+                model = getattr(synthesizer, attr, None)
+                if model is not None:
+                    setattr(synthesizer, attr, torch.compile(
+                        model, mode='reduce-overhead', fullgraph=False))
+
+            synthesizer._compiled = True
+            logger.info("TTS model compiled with torch.compile (reduce-overhead)")
+
+        except Exception as e:
+            logger.warning(f"Could not compile TTS model: {str(e)}")
+
+    def _load_model(self, model_name: str):
+        """Load a TTS model, reusing an already-loaded one when possible."""
+        key = (model_name, self.device)
+        model = TTSEngine._model_cache.get(key)
+
+        if model is None:
+            from TTS.api import TTS
+
+            logger.info(f"Loading TTS model: {model_name}")
+            model = TTS(model_name=model_name, progress_bar=False, gpu=self.device == 'cuda')
+            TTSEngine._model_cache[key] = model
+        else:
+            logger.info(f"Reusing cached TTS model: {model_name}")
+
+        return model
     
     def _get_model_for_language(self, language: str) -> str:
         """Get the best TTS model for the specified language."""
@@ -203,39 +378,29 @@ class TTSEngine:
             output_path = os.path.join(output_dir, output_filename)
             
             logger.info(f"Generating audio for chapter {chapter_num}: {chapter_title}")
-            
-            # Split text into chunks if too long
-            text_chunks = self._split_text_for_tts(text)
-            
-            if len(text_chunks) == 1:
-                # Single chunk - direct conversion
-                self._generate_audio_chunk(text_chunks[0], output_path)
-            else:
-                # Multiple chunks - generate and merge
-                chunk_files = []
-                temp_dir = tempfile.mkdtemp()
-                
-                try:
-                    for i, chunk in enumerate(text_chunks):
-                        chunk_path = os.path.join(temp_dir, f"chunk_{i:03d}.wav")
-                        self._generate_audio_chunk(chunk, chunk_path)
-                        chunk_files.append(chunk_path)
-                    
-                    # Merge chunks
-                    self._merge_audio_chunks(chunk_files, output_path)
-                    
-                finally:
-                    # Clean up temporary files
-                    for file in chunk_files:
-                        try:
-                            os.remove(file)
-                        except:
-                            pass
-                    try:
-                        os.rmdir(temp_dir)
-                    except:
-                        pass
-            
+
+            # Stream chunks straight into one open SoundFile: the file
+            # is opened and its header written once per chapter, each
+            # chunk is appended as it is synthesized, and peak memory
+            # stays bounded by a single chunk's waveform
+            chunks = self._split_text_for_tts(text)
+            speaker = self._resolve_speaker()
+            sample_rate = self.output_sample_rate
+            pause = np.zeros(int(sample_rate * 0.3), dtype=np.float32)
+
+            with sf.SoundFile(output_path, 'w', samplerate=sample_rate,
+                              channels=1, subtype='PCM_16',
+                              format='WAV') as out_file:
+                with torch.inference_mode(), \
+                        torch.autocast(device_type='cuda',
+                                       dtype=self._autocast_dtype,
+                                       enabled=self.device == 'cuda'):
+                    for i, chunk in enumerate(chunks):
+                        wav = self._resample(self._render_chunk(chunk, speaker))
+                        if i:
+                            out_file.write(pause)
+                        out_file.write(np.asarray(wav, dtype=np.float32))
+
             if os.path.exists(output_path):
                 file_size = os.path.getsize(output_path) / 1024  # KB
                 logger.info(f"Generated audio file: {output_path} ({file_size:.1f} KB)")
@@ -248,117 +413,433 @@ class TTSEngine:
             logger.error(f"Error generating audio for chapter {chapter_num}: {str(e)}")
             return None
     
-    def _generate_audio_chunk(self, text: str, output_path: str):
-        """Generate audio for a single text chunk."""
+    def text_to_speech_stream(self, text: str):
+        """Yield waveform pieces for one chapter as they are synthesized.
+
+        Chunk-level counterpart of iter_chapter_waveforms: each chunk
+        (and the pause that precedes it) is handed to the consumer as
+        soon as the model finishes it, so downstream encoding or
+        merging starts immediately instead of waiting for the whole
+        chapter WAV.
+
+        Args:
+            text (str): Text content to convert
+
+        Yields:
+            np.ndarray: float32 waveform at output_sample_rate
+        """
+        chunks = self._split_text_for_tts(text)
+        speaker = self._resolve_speaker()
+        pause = np.zeros(int(self.output_sample_rate * 0.3), dtype=np.float32)
+
+        for i, chunk in enumerate(chunks):
+            # Contexts are entered per chunk, not around the loop: a
+            # suspended generator would otherwise leave inference_mode
+            # active in the consumer's frame between yields
+            with torch.inference_mode(), \
+                    torch.autocast(device_type='cuda',
+                                   dtype=self._autocast_dtype,
+                                   enabled=self.device == 'cuda'):
+                wav = self._resample(self._render_chunk(chunk, speaker))
+
+            if i:
+                yield pause
+            yield np.asarray(wav, dtype=np.float32)
+
+    def text_to_speech_batch(self, entries: List[tuple], output_dir: str,
+                             progress_callback=None) -> List[Dict[str, Any]]:
+        """
+        Convert a batch of cleaned chapter texts to speech.
+
+        Centralizing the chapter loop here lets the engine own scheduling
+        for the whole batch instead of being driven one call at a time
+        from the CLI loop.
+
+        Args:
+            entries: Iterable of (chapter_num, chapter_title, text) tuples
+            output_dir (str): Output directory
+            progress_callback: Optional callable invoked after each chapter
+
+        Returns:
+            List of {'file', 'title', 'chapter_num'} dicts for generated files
+        """
+        # Alternative engine owns its own file writing; keep the simple loop
+        if self._use_alternative_engine and self.alternative_engine:
+            audio_files = []
+            for chapter_num, title, text in entries:
+                audio_file = self.alternative_engine.text_to_speech(
+                    text, title, output_dir, chapter_num)
+                if audio_file:
+                    audio_files.append({
+                        'file': audio_file,
+                        'title': title,
+                        'chapter_num': chapter_num
+                    })
+                if progress_callback:
+                    progress_callback(chapter_num)
+            return audio_files
+
+        # CPU synthesis is compute-bound and the model object is not
+        # safe for concurrent inference, so on CPU-only hosts chapters
+        # fan out to a process pool when the config asks for workers
+        workers = min(os.cpu_count() or 1, self.config.get('max_workers', 1))
+        if self.device == 'cpu' and workers > 1 and len(entries) > 1:
+            return self._text_to_speech_batch_cpu(
+                entries, output_dir, progress_callback, workers)
+
+        audio_files = []
+        sample_rate = self.output_sample_rate
+
+        # Writer thread drains finished waveforms so disk encoding overlaps
+        # with the next chapter's synthesis; the bounded queue caps how many
+        # chapter waveforms can be in flight at once.
+        write_queue = queue.Queue(maxsize=4)
+
+        def _writer():
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    break
+                output_path, wav, chapter_num = item
+                try:
+                    sf.write(output_path, wav, sample_rate)
+                    file_size = os.path.getsize(output_path) / 1024  # KB
+                    logger.info(f"Generated audio file: {output_path} ({file_size:.1f} KB)")
+                except Exception as e:
+                    logger.error(f"Error writing audio file {output_path}: {str(e)}")
+                finally:
+                    if progress_callback:
+                        progress_callback(chapter_num)
+                    write_queue.task_done()
+
+        writer = threading.Thread(target=_writer, daemon=True)
+        writer.start()
+
         try:
-            # Generate audio
-            if hasattr(self.tts_model, 'speakers') and self.tts_model.speakers and self.speaker != 'default':
-                # Model supports speakers
-                wav = self.tts_model.tts(text=text, speaker=self.speaker)
-            else:
-                # Standard TTS
-                wav = self.tts_model.tts(text=text)
-            
-            # Convert to numpy array if needed
-            if isinstance(wav, list):
-                wav = np.array(wav)
-            
-            # Apply speed and pitch modifications
-            wav = self._apply_audio_effects(wav)
-            
-            # Save audio file
-            sf.write(output_path, wav, self.tts_model.synthesizer.output_sample_rate)
-            
+            for chapter_num, title, text in entries:
+                if not text.strip():
+                    logger.warning(f"Empty text for chapter {chapter_num}")
+                    if progress_callback:
+                        progress_callback(chapter_num)
+                    continue
+
+                try:
+                    safe_title = self._create_safe_filename(title)
+                    output_filename = f"chapter_{chapter_num:03d}_{safe_title}.wav"
+                    output_path = os.path.join(output_dir, output_filename)
+
+                    logger.info(f"Generating audio for chapter {chapter_num}: {title}")
+
+                    wav = self._synthesize_waveform(text)
+                    write_queue.put((output_path, wav, chapter_num))
+
+                    audio_files.append({
+                        'file': output_path,
+                        'title': title,
+                        'chapter_num': chapter_num
+                    })
+
+                except Exception as e:
+                    logger.error(f"Error generating audio for chapter {chapter_num}: {str(e)}")
+                    if progress_callback:
+                        progress_callback(chapter_num)
+
+        finally:
+            write_queue.put(None)
+            writer.join()
+
+        return audio_files
+
+    def _text_to_speech_batch_cpu(self, entries: List[tuple], output_dir: str,
+                                  progress_callback, workers: int) -> List[Dict[str, Any]]:
+        """Fan chapters out to a process pool of per-worker engines.
+
+        Each worker loads its own model in _init_worker (a few seconds,
+        paid once per worker) and then chapters scale near-linearly
+        with core count. executor.map preserves entry order, so results
+        come back in chapter order.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        logger.info(f"Synthesizing {len(entries)} chapters on {workers} CPU workers")
+
+        jobs = [(chapter_num, title, text, output_dir)
+                for chapter_num, title, text in entries]
+
+        audio_files = []
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.config,)) as executor:
+            for job, audio_file in zip(jobs, executor.map(_worker_text_to_speech, jobs)):
+                chapter_num, title = job[0], job[1]
+                if audio_file:
+                    audio_files.append({
+                        'file': audio_file,
+                        'title': title,
+                        'chapter_num': chapter_num
+                    })
+                if progress_callback:
+                    progress_callback(chapter_num)
+
+        return audio_files
+
+    @property
+    def output_sample_rate(self) -> int:
+        """Sample rate of the waveforms this engine produces."""
+        native = self.sample_rate
+        if self.target_sample_rate and self.target_sample_rate != native:
+            return self.target_sample_rate
+        return native
+
+    def _resample(self, wav):
+        """Resample a waveform to the configured sample rate, if different.
+
+        Uses a torchaudio Resample transform built once and kept on the
+        engine's device, so on GPU runs the waveform is resampled before
+        it ever crosses back to the host. Falls back to librosa when
+        torchaudio is unavailable; if neither works, the configured rate
+        is dropped so written files keep a consistent rate.
+        """
+        native = self.sample_rate
+        target = self.target_sample_rate
+
+        if not target or target == native:
+            return wav
+
+        try:
+            import torchaudio
+
+            if self._resampler is None:
+                self._resampler = torchaudio.transforms.Resample(
+                    orig_freq=native, new_freq=target).to(self.device)
+
+            tensor = torch.as_tensor(wav, dtype=torch.float32, device=self.device)
+            return self._resampler(tensor).cpu().numpy()
+
+        except ImportError:
+            try:
+                return _get_librosa().resample(np.asarray(wav, dtype=np.float32),
+                                               orig_sr=native, target_sr=target)
+            except Exception as e:
+                logger.warning(f"Could not resample audio to {target} Hz: {str(e)}")
+                self.target_sample_rate = None
+                return wav
+
         except Exception as e:
-            logger.error(f"Error generating audio chunk: {str(e)}")
-            raise
-    
+            logger.warning(f"Could not resample audio to {target} Hz: {str(e)}")
+            self.target_sample_rate = None
+            return wav
+
+    def iter_chapter_waveforms(self, entries: List[tuple], progress_callback=None):
+        """Yield (chapter_num, title, waveform) for each non-empty chapter.
+
+        Feeds the streaming output path: waveforms stay in memory and are
+        handed straight to the consumer instead of being written out as
+        per-chapter WAV files and read back for merging.
+
+        Args:
+            entries: Iterable of (chapter_num, chapter_title, text) tuples
+            progress_callback: Optional callable invoked after each chapter
+        """
+        for chapter_num, title, text in entries:
+            if not text.strip():
+                logger.warning(f"Empty text for chapter {chapter_num}")
+                if progress_callback:
+                    progress_callback(chapter_num)
+                continue
+
+            try:
+                logger.info(f"Generating audio for chapter {chapter_num}: {title}")
+                wav = self._synthesize_waveform(text)
+            except Exception as e:
+                logger.error(f"Error generating audio for chapter {chapter_num}: {str(e)}")
+                if progress_callback:
+                    progress_callback(chapter_num)
+                continue
+
+            yield chapter_num, title, wav
+
+            if progress_callback:
+                progress_callback(chapter_num)
+
+    def _synthesize_waveform(self, text: str):
+        """Synthesize a full chapter into one in-memory waveform.
+
+        The per-chunk loop stays (the models behind TTS.api take one
+        utterance at a time), but everything that can be paid once per
+        chapter instead of once per chunk is hoisted here: the speaker
+        is resolved once and a single inference_mode region covers all
+        chunks rather than being entered and torn down per call.
+        """
+        chunks = self._split_text_for_tts(text)
+        speaker = self._resolve_speaker()
+
+        # autocast runs the matmul/conv-heavy ops in half precision on
+        # GPU, roughly halving memory bandwidth; a no-op on CPU
+        with torch.inference_mode(), \
+                torch.autocast(device_type='cuda', dtype=self._autocast_dtype,
+                               enabled=self.device == 'cuda'):
+            rendered = [self._render_chunk(chunk, speaker) for chunk in chunks]
+
+        if len(rendered) == 1:
+            return self._resample(rendered[0])
+
+        # Stitch chunks with a short pause between them, into one buffer
+        # sized up front: zeros gives the pause gaps for free and each
+        # chunk is copied exactly once into its slice
+        pause_len = int(self.sample_rate * 0.3)
+        total = sum(len(wav) for wav in rendered) + pause_len * (len(rendered) - 1)
+
+        out = np.zeros(total, dtype=np.float32)
+        offset = 0
+        for i, wav in enumerate(rendered):
+            if i:
+                offset += pause_len
+            out[offset:offset + len(wav)] = wav
+            offset += len(wav)
+
+        return self._resample(out)
+
+    def _resolve_speaker(self) -> Optional[str]:
+        """Return the speaker to synthesize with, or None for single-speaker models."""
+        if self._has_speakers and self.speaker != 'default':
+            return self.speaker
+        return None
+
+    def _render_chunk(self, text: str, speaker: Optional[str] = None):
+        """Synthesize one text chunk and return the processed waveform.
+
+        Callers are expected to hold torch.inference_mode() around the
+        whole chapter; inference_mode skips autograd tracking and
+        version-counter bookkeeping on every op — pure overhead here,
+        since synthesis never backpropagates.
+        """
+        if speaker is not None:
+            # Model supports speakers
+            wav = self.tts_model.tts(text=text, speaker=speaker)
+        else:
+            # Standard TTS
+            wav = self.tts_model.tts(text=text)
+
+        # Normalize to a float32 numpy array without a float64 detour:
+        # tensors come straight off the device via .cpu().numpy(), and
+        # Python float lists get an explicit dtype - np.array on a float
+        # list defaults to float64, doubling every later copy and write
+        if torch.is_tensor(wav):
+            wav = wav.detach().cpu().numpy()
+        wav = np.asarray(wav, dtype=np.float32)
+
+        # The host copy above dropped the last reference to device
+        # memory; periodically hand cached blocks back to the driver so
+        # long chapters don't ratchet up reserved GPU memory
+        if self.device == 'cuda':
+            self._chunks_since_release += 1
+            if self._chunks_since_release >= self._EMPTY_CACHE_INTERVAL:
+                torch.cuda.empty_cache()
+                self._chunks_since_release = 0
+
+        # Apply speed and pitch modifications
+        return self._apply_audio_effects(wav)
+
     def _apply_audio_effects(self, wav) -> any:
-        """Apply speed and pitch effects to audio."""
+        """Apply speed and pitch effects to audio.
+
+        Prefers torchaudio, which runs the STFT work as torch ops on the
+        engine's device - on GPU the waveform never round-trips to the
+        host for a NumPy phase vocoder. librosa remains the CPU fallback
+        with the original semantics.
+        """
+        if not self._effects_needed:
+            return wav
+
+        try:
+            return self._apply_effects_torchaudio(wav)
+        except ImportError:
+            pass  # torchaudio not installed; librosa below
+        except Exception as e:
+            logger.warning(f"torchaudio effects failed, falling back to librosa: {str(e)}")
+
         try:
             # Apply speed change
             if self.speed != 1.0:
                 # Simple speed change by resampling
-                import librosa
-                wav = librosa.effects.time_stretch(wav, rate=1.0/self.speed)
-            
+                wav = _get_librosa().effects.time_stretch(wav, rate=1.0/self.speed)
+
             # Apply pitch change
             if self.pitch != 1.0:
                 # Simple pitch shift
-                import librosa
                 n_steps = 12 * np.log2(self.pitch)  # Convert to semitones
-                wav = librosa.effects.pitch_shift(wav, sr=self.tts_model.synthesizer.output_sample_rate, 
+                wav = _get_librosa().effects.pitch_shift(wav, sr=self.sample_rate,
                                                 n_steps=n_steps)
-            
+
             return wav
-            
+
         except Exception as e:
             logger.warning(f"Could not apply audio effects: {str(e)}")
             return wav  # Return unmodified audio
+
+    def _apply_effects_torchaudio(self, wav):
+        """Speed/pitch effects as torch ops on the engine's device."""
+        import torchaudio
+
+        tensor = torch.as_tensor(wav, dtype=torch.float32, device=self.device)
+
+        if self.speed != 1.0:
+            # Phase-vocoder time stretch over the complex STFT; same
+            # rate mapping as the librosa path
+            n_fft = 1024
+            hop_length = n_fft // 4
+            window = torch.hann_window(n_fft, device=tensor.device)
+            stft = torch.stft(tensor, n_fft=n_fft, hop_length=hop_length,
+                              window=window, return_complex=True)
+            phase_advance = torch.linspace(
+                0, np.pi * hop_length, stft.shape[0],
+                device=tensor.device)[..., None]
+            stft = torchaudio.functional.phase_vocoder(
+                stft, rate=1.0 / self.speed, phase_advance=phase_advance)
+            tensor = torch.istft(stft, n_fft=n_fft, hop_length=hop_length,
+                                 window=window)
+
+        if self.pitch != 1.0:
+            n_steps = float(12 * np.log2(self.pitch))  # Convert to semitones
+            tensor = torchaudio.functional.pitch_shift(
+                tensor, self.sample_rate, n_steps)
+
+        return tensor.cpu().numpy()
     
     def _split_text_for_tts(self, text: str, max_length: int = 500) -> List[str]:
-        """Split text into chunks suitable for TTS processing."""
+        """Split text into chunks suitable for TTS processing.
+
+        Sentences come from one pass of a compiled regex and chunks are
+        greedy runs of whole sentences tracked as (start, end) offsets
+        into the original text - each chunk is a single slice, with no
+        per-sentence string concatenation. Terminators stay attached, so
+        questions and exclamations keep their intonation, and a lone
+        sentence longer than max_length stands as its own chunk.
+        """
         if len(text) <= max_length:
             return [text]
-        
+
         chunks = []
-        sentences = text.split('. ')
-        
-        current_chunk = ""
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) + 2 <= max_length:  # +2 for '. '
-                if current_chunk:
-                    current_chunk += ". " + sentence
-                else:
-                    current_chunk = sentence
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk + ".")
-                current_chunk = sentence
-        
-        if current_chunk:
-            if not current_chunk.endswith('.'):
-                current_chunk += "."
-            chunks.append(current_chunk)
-        
+        chunk_start = None
+        prev_end = 0
+
+        for match in _SENTENCE_RE.finditer(text):
+            if chunk_start is None:
+                chunk_start = match.start()
+            elif match.end() - chunk_start > max_length:
+                chunks.append(text[chunk_start:prev_end].rstrip())
+                chunk_start = match.start()
+            prev_end = match.end()
+
+        if chunk_start is not None and prev_end > chunk_start:
+            chunks.append(text[chunk_start:prev_end].rstrip())
+
         return chunks
     
-    def _merge_audio_chunks(self, chunk_files: List[str], output_path: str):
-        """Merge multiple audio chunks into a single file."""
-        try:
-            from pydub import AudioSegment
-            
-            # Load first chunk
-            combined = AudioSegment.from_wav(chunk_files[0])
-            
-            # Add small pause between chunks
-            pause = AudioSegment.silent(duration=300)  # 300ms pause
-            
-            # Merge remaining chunks
-            for chunk_file in chunk_files[1:]:
-                chunk = AudioSegment.from_wav(chunk_file)
-                combined += pause + chunk
-            
-            # Export as WAV
-            combined.export(output_path, format="wav")
-            
-        except Exception as e:
-            logger.error(f"Error merging audio chunks: {str(e)}")
-            raise
-    
     def _create_safe_filename(self, title: str) -> str:
         """Create a safe filename from chapter title."""
-        # Remove invalid characters
-        safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_. "
-        safe_title = ''.join(c for c in title if c in safe_chars)
-        
-        # Replace spaces with underscores and limit length
-        safe_title = safe_title.replace(' ', '_')[:50]
-        
-        # Remove leading/trailing dots and dashes
-        safe_title = safe_title.strip('.-_')
-        
-        return safe_title or "chapter"
+        return sanitize(title)
     
     def get_available_voices(self) -> List[str]:
         """Get list of available voices/speakers."""
@@ -383,11 +864,28 @@ class TTSEngine:
         else:
             return word_count / 10.0
     
+    @classmethod
+    def shutdown_all(cls):
+        """Drop every cached model and release GPU memory.
+
+        cleanup() deliberately leaves _model_cache warm so the next
+        engine in the process skips the multi-second reload; call this
+        at process teardown when the models are truly done.
+        """
+        try:
+            cls._model_cache.clear()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            logger.info("TTS model cache cleared")
+        except Exception as e:
+            logger.warning(f"Error during model cache shutdown: {str(e)}")
+
     def cleanup(self):
         """Clean up resources."""
         try:
-            if self.tts_model:
-                del self.tts_model
+            # Drop only the instance reference; the class-level cache keeps
+            # the model warm for any engine constructed later in the process
+            self.tts_model = None
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
             logger.info("TTS engine cleaned up")